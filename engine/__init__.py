@@ -0,0 +1,8 @@
+"""
+Shared Breakout engine: physics, rendering, audio and tooling used by every
+game variant. Importing the package loads nothing else; variants live in
+engine.variants and are imported by the launcher only when selected.
+
+    python -m engine            # list the variants
+    python -m engine retro
+"""
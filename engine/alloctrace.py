@@ -0,0 +1,136 @@
+"""
+Per-frame allocation and GC tracker for chasing a zero-allocation loop.
+
+Each frame is split into named phases. For every phase the tracker records
+blocks and bytes still alive at the end of the phase, the transient
+high-water mark reached inside it (temporaries that were freed again), and
+any GC pauses that started while it ran. Every `snapshot_every` frames a
+tracemalloc snapshot is diffed against the previous one to attribute
+retained growth to source lines. Work that happens outside the frame
+phases (level generation, loading) can be reported with timing().
+"""
+
+import atexit
+import fnmatch
+import gc
+import re
+import sys
+import time
+import tracemalloc
+
+_FIELDS = ('frames', 'blocks', 'bytes', 'peak', 'gc', 'gc_ms', 'over')
+
+
+class AllocTracker:
+    def __init__(self, warmup=120, limit=0, snapshot_every=600, top=10,
+                 depth=1, report_at_exit=True):
+        self.warmup = warmup
+        # Transient bytes a phase may allocate once warm before it counts as over
+        self.limit = limit
+        self.snapshot_every = snapshot_every
+        self.top = top
+        self.frames = 0
+        self.phases = {}
+        self.current = None
+        self.lines = {}
+        self.timings = {}
+        self._blocks = 0
+        self._bytes = 0
+        self._gc_start = 0.0
+        self._snapshot = None
+        tracemalloc.start(depth)
+        # Hide the tracker's own bookkeeping, including the pattern
+        # matching that filter_traces() does
+        self._filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, fnmatch.__file__),
+            tracemalloc.Filter(False, re.__file__.replace('__init__.py', '*')),
+            tracemalloc.Filter(False, __file__),
+        ]
+        gc.callbacks.append(self._on_gc)
+        if report_at_exit:
+            atexit.register(self.print_report)
+
+    def phase(self, name):
+        """End the running phase (if any) and start `name`"""
+        if self.current is not None:
+            self._close()
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = dict.fromkeys(_FIELDS, 0)
+        self.current = stats
+        tracemalloc.reset_peak()
+        self._bytes = tracemalloc.get_traced_memory()[0]
+        self._blocks = sys.getallocatedblocks()
+
+    def timing(self, name, ms):
+        """Record one duration for `name`"""
+        count, total, worst = self.timings.get(name, (0, 0.0, 0.0))
+        self.timings[name] = (count + 1, total + ms, max(worst, ms))
+
+    def end_frame(self):
+        if self.current is not None:
+            self._close()
+            self.current = None
+        self.frames += 1
+        if self.snapshot_every and self.frames % self.snapshot_every == 0:
+            self._diff_snapshot()
+
+    def _close(self):
+        blocks = sys.getallocatedblocks() - self._blocks
+        current, peak = tracemalloc.get_traced_memory()
+        stats = self.current
+        if self.frames < self.warmup:
+            return
+        transient = peak - self._bytes
+        stats['frames'] += 1
+        stats['blocks'] += blocks
+        stats['bytes'] += current - self._bytes
+        stats['peak'] += transient
+        if transient > self.limit:
+            stats['over'] += 1
+
+    def _on_gc(self, phase, info):
+        if phase == 'start':
+            self._gc_start = time.perf_counter()
+        elif self.current is not None and self.frames >= self.warmup:
+            self.current['gc'] += 1
+            self.current['gc_ms'] += (time.perf_counter() - self._gc_start) * 1000
+
+    def _diff_snapshot(self):
+        snapshot = tracemalloc.take_snapshot().filter_traces(self._filters)
+        if self._snapshot is not None and self.frames > self.warmup:
+            for stat in snapshot.compare_to(self._snapshot, 'lineno'):
+                if stat.count_diff > 0:
+                    frame = stat.traceback[0]
+                    key = f"{frame.filename}:{frame.lineno}"
+                    self.lines[key] = self.lines.get(key, 0) + stat.size_diff
+        self._snapshot = snapshot
+
+    def report(self):
+        out = [f"Allocation report: {self.frames} frames ({self.warmup} warmup)",
+               f"{'phase':<12}{'blocks/f':>10}{'KiB/f':>10}{'peak KiB/f':>12}"
+               f"{'gc':>6}{'gc ms':>9}{'over':>7}"]
+        for name, s in self.phases.items():
+            n = s['frames'] or 1
+            out.append(f"{name:<12}{s['blocks']/n:>10.2f}{s['bytes']/n/1024:>10.2f}"
+                       f"{s['peak']/n/1024:>12.2f}{s['gc']:>6}{s['gc_ms']:>9.2f}"
+                       f"{s['over']:>7}")
+        if self.timings:
+            out.append(f"{'timing':<12}{'count':>10}{'avg ms':>10}{'max ms':>12}")
+            for name, (count, total, worst) in self.timings.items():
+                out.append(f"{name:<12}{count:>10}{total/count:>10.2f}{worst:>12.2f}")
+        if self.lines:
+            out.append("Retained growth by line:")
+            ranked = sorted(self.lines.items(), key=lambda item: -item[1])
+            for line, size in ranked[:self.top]:
+                out.append(f"  {size/1024:>9.1f} KiB  {line}")
+        return '\n'.join(out)
+
+    def print_report(self):
+        print(self.report())
+
+    def close(self):
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        tracemalloc.stop()
@@ -0,0 +1,73 @@
+"""
+Process-wide asset caches.
+
+Fonts, synthesized sounds, CRT overlays and level packs are built on first
+use and shared by everything running in the process: the tournament's
+tiles, a variant's menu screens and every game it restarts. The launcher
+runs one variant per process, so nothing carries over between variants;
+the caches are dropped when pygame.quit() runs, since the objects in them
+die with it.
+"""
+
+import pygame
+
+from . import audio
+from .crt import CRTEffect
+from .levelpack import LevelPack
+
+_fonts = {}
+_sounds = {}
+_crts = {}
+_packs = {}
+_registered = False
+
+
+def _register():
+    global _registered
+    if not _registered:
+        pygame.register_quit(clear)
+        _registered = True
+
+
+def font(size, name=None):
+    """Default pygame font, or a system font when name is given"""
+    key = (name, size)
+    cached = _fonts.get(key)
+    if cached is None:
+        _register()
+        cached = _fonts[key] = (pygame.font.SysFont(name, size) if name
+                                else pygame.font.Font(None, size))
+    return cached
+
+
+def sound(name):
+    cached = _sounds.get(name)
+    if cached is None:
+        _register()
+        audio.init_mixer()
+        cached = _sounds[name] = pygame.mixer.Sound(buffer=audio.synthesize(name))
+    return cached
+
+
+def crt(size):
+    cached = _crts.get(size)
+    if cached is None:
+        _register()
+        cached = _crts[size] = CRTEffect(size)
+    return cached
+
+
+def level_pack(path):
+    cached = _packs.get(path)
+    if cached is None:
+        cached = _packs[path] = LevelPack(path)
+    return cached
+
+
+def clear():
+    global _registered
+    _fonts.clear()
+    _sounds.clear()
+    _crts.clear()
+    # pygame.quit() forgets its quit callbacks
+    _registered = False
@@ -0,0 +1,66 @@
+"""
+Synthesized chiptune sound effects.
+
+Every variant's effects come from one table of recipes. Samples are
+generated once per process (see assets.sound) and shared by every
+SoundEngine in it, so tournament tiles and restarted games never
+re-synthesize audio.
+"""
+
+import array
+import random
+
+import pygame
+
+SAMPLE_RATE = 44100
+
+# name -> (generator, args)
+RECIPES = {
+    'hit': ('tone', (800, 0.1, 'square')),
+    'break': ('tone', (1200, 0.08, 'square')),
+    'start': ('tone', (1000, 0.2, 'saw')),
+    'powerup': ('tone', (400, 0.3, 'triangle')),
+    'death': ('noise', (0.4,)),
+    'music': ('melody', ((523, 659, 784, 659, 523, 392), 0.2)),
+}
+
+
+def init_mixer():
+    if not pygame.mixer.get_init():
+        pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2, buffer=512)
+
+
+def tone(freq, duration, wave_type='square'):
+    samples = array.array('h')
+    for i in range(int(SAMPLE_RATE * duration)):
+        phase = (i / SAMPLE_RATE * freq) % 1
+        if wave_type == 'square':
+            samples.append(32767 if phase < 0.5 else -32768)
+        elif wave_type == 'saw':
+            samples.append(int(32767 * (2 * phase - 1)))
+        else:
+            samples.append(int(32767 * (2 * abs(phase - 0.5) - 0.5)))
+    return samples
+
+
+def noise(duration):
+    return array.array('h', [random.randint(-32768, 32767)
+                             for _ in range(int(SAMPLE_RATE * duration))])
+
+
+def melody(notes, duration):
+    samples = array.array('h')
+    for freq in notes:
+        samples.extend(tone(freq, duration))
+    return samples
+
+
+def synthesize(name):
+    generator, args = RECIPES[name]
+    return globals()[generator](*args)
+
+
+class SoundEngine:
+    def __init__(self, names=('hit', 'break', 'death', 'start')):
+        from . import assets
+        self.sfx = {name: assets.sound(name) for name in names}
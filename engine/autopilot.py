@@ -0,0 +1,107 @@
+"""
+Analytic autopilot for soak tests and benchmarks.
+
+The ball's crossing of the paddle row is solved in closed form: the flight
+is unfolded across the side walls (and the ceiling, if the ball is rising)
+and folded back with a triangle wave, so no per-step simulation is needed.
+The autopilot drives the paddle by overriding K_LEFT/K_RIGHT in the key
+state a variant already polls, and serves/restarts by posting key events.
+"""
+
+import random
+
+import pygame
+
+
+def fold(x, span):
+    """Reflect an unbounded coordinate into [0, span]"""
+    if span <= 0:
+        return 0.0
+    x %= 2 * span
+    return x if x <= span else 2 * span - x
+
+
+def intercept_x(x, y, vx, vy, size, row_y, width):
+    """Left edge of the ball when its bottom reaches row_y, or None if it never will"""
+    if vy == 0:
+        return None
+    target = row_y - size
+    # Rising balls bounce off the ceiling first
+    distance = target - y if vy > 0 else y + target
+    if distance < 0:
+        return None
+    return fold(x + vx * distance / abs(vy), width - size)
+
+
+class PilotKeys:
+    """Key state with the arrow keys replaced by the autopilot's decision"""
+    def __init__(self, keys, direction):
+        self.keys = keys
+        self.direction = direction
+
+    def __getitem__(self, key):
+        if key == pygame.K_LEFT:
+            return self.direction < 0
+        if key == pygame.K_RIGHT:
+            return self.direction > 0
+        return self.keys[key]
+
+
+class Autopilot:
+    def __init__(self, width, skill=1.0, noise=None, serve_delay=30, seed=None):
+        self.width = width
+        self.skill = max(0.0, min(1.0, skill))
+        # Aim error in pixels; by default it grows as skill drops
+        self.noise = 24 * (1 - self.skill) if noise is None else noise
+        # Frames of hesitation after each bounce
+        self.reaction = round(12 * (1 - self.skill))
+        self.serve_delay = serve_delay
+        self.rng = random.Random(seed)
+        self.aim = 0.0
+        self.english = 0.0
+        self.rising = None
+        self.wait = 0
+        self.idle = {}
+
+    def direction(self, ball_rect, ball_speed, paddle_rect):
+        """-1, 0 or 1 to move the paddle toward the predicted intercept"""
+        vx, vy = ball_speed
+        rising = vy < 0
+        if rising != self.rising:
+            self.rising = rising
+            self.aim = self.rng.gauss(0, self.noise) if self.noise else 0.0
+            # Catch the ball off-centre so rallies keep changing angle
+            self.english = self.rng.uniform(-0.25, 0.25)
+            self.wait = self.reaction
+        if self.wait:
+            self.wait -= 1
+            return 0
+
+        x = intercept_x(ball_rect.x, ball_rect.y, vx, vy, ball_rect.width,
+                        paddle_rect.top, self.width)
+        if x is None:
+            target = self.width / 2
+        else:
+            target = (x + ball_rect.width / 2 + self.aim
+                      - self.english * paddle_rect.width)
+        error = target - paddle_rect.centerx
+        deadzone = max(2, paddle_rect.width // 8)
+        if error < -deadzone:
+            return -1
+        if error > deadzone:
+            return 1
+        return 0
+
+    def press(self, keys, ball_rect, ball_speed, paddle_rect):
+        return PilotKeys(keys, self.direction(ball_rect, ball_speed, paddle_rect))
+
+    def tap(self, key, waiting=True):
+        """Post a key press once `waiting` has held for serve_delay frames"""
+        if not waiting:
+            self.idle[key] = 0
+            return
+        self.idle[key] = self.idle.get(key, 0) + 1
+        if self.idle[key] >= self.serve_delay:
+            self.idle[key] = 0
+            pygame.event.post(pygame.event.Event(
+                pygame.KEYDOWN, key=key, mod=0, unicode='', scancode=0))
@@ -0,0 +1,250 @@
+"""
+Background gameplay capture.
+
+`FrameCapture.capture()` runs on the game thread and only blits the
+presented frame into a free buffer from a fixed pool; a writer thread
+encodes and writes it, then hands the buffer back. When every buffer is
+still waiting to be written the frame is dropped and counted rather than
+stalling the loop. The output format follows the path:
+
+    *.bkrl   run-length encoded frames with a per-frame palette
+    *.raw    raw RGB frames
+    other    a directory of numbered PNGs
+
+Breakout frames are a few flat colours and change little from one frame
+to the next, so .bkrl frames are mostly stored as the XOR against the
+previous frame, which is almost entirely zero runs; a keyframe every
+`keyframe_every` frames keeps the file seekable. Layout (little-endian):
+
+    header   magic b'BKRL', version u16, width u16, height u16
+    frame    kind u8 (0 keyframe, 1 XOR delta), runs u32, palette size u16,
+             palette (size x u32 RGBX), run lengths (runs x u32),
+             palette indices (runs x u8, or u16 past 256 colours)
+
+    python -m engine.capture recording.bkrl frames/    # decode to PNGs
+"""
+
+import argparse
+import atexit
+import array
+import itertools
+import os
+import queue
+import struct
+import sys
+import threading
+
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+RLE_MAGIC = b'BKRL'
+RLE_VERSION = 1
+RLE_HEADER = struct.Struct('<4sHHH')
+RLE_FRAME = struct.Struct('<BIH')
+KEYFRAME = 0
+DELTA = 1
+RAW_MAGIC = b'BKRW'
+RAW_HEADER = struct.Struct('<4sHH')
+
+_STOP = object()
+
+
+def _le(values):
+    """array('I'/'H'/'B') as little-endian bytes"""
+    if sys.byteorder == 'big' and values.itemsize > 1:
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def encode_rle(pixels, previous=None):
+    """One .bkrl frame from packed RGBX bytes, as a delta if given previous"""
+    kind = KEYFRAME if previous is None else DELTA
+    if numpy is not None:
+        px = numpy.frombuffer(pixels, numpy.uint32)
+        if previous is not None:
+            px = px ^ numpy.frombuffer(previous, numpy.uint32)
+        starts = numpy.concatenate(([0], numpy.flatnonzero(px[1:] != px[:-1]) + 1))
+        lengths = numpy.diff(numpy.append(starts, px.size))
+        palette, index = numpy.unique(px[starts], return_inverse=True)
+        index = index.astype(numpy.uint8 if len(palette) <= 256 else '<u2')
+        return (RLE_FRAME.pack(kind, len(starts), len(palette))
+                + palette.astype('<u4').tobytes() + lengths.astype('<u4').tobytes()
+                + index.tobytes())
+    px = array.array('I')
+    px.frombytes(pixels)
+    if previous is not None:
+        before = array.array('I')
+        before.frombytes(previous)
+        px = array.array('I', [a ^ b for a, b in zip(px, before)])
+    colors, lengths, index = {}, array.array('I'), []
+    for value, run in itertools.groupby(px):
+        lengths.append(sum(1 for _ in run))
+        index.append(colors.setdefault(value, len(colors)))
+    palette = array.array('I', colors)
+    index = array.array('B' if len(palette) <= 256 else 'H', index)
+    return (RLE_FRAME.pack(kind, len(lengths), len(palette))
+            + _le(palette) + _le(lengths) + _le(index))
+
+
+def read_rle(path):
+    """Yield ((width, height), RGBX bytes) for every frame in a .bkrl file"""
+    with open(path, 'rb') as f:
+        magic, version, width, height = RLE_HEADER.unpack(f.read(RLE_HEADER.size))
+        if magic != RLE_MAGIC or version != RLE_VERSION:
+            raise ValueError(f"{path} is not a version {RLE_VERSION} capture")
+        previous = None
+        while True:
+            head = f.read(RLE_FRAME.size)
+            if len(head) < RLE_FRAME.size:
+                return
+            kind, runs, colors = RLE_FRAME.unpack(head)
+            wide = colors > 256
+            palette = array.array('I', f.read(colors * 4))
+            lengths = array.array('I', f.read(runs * 4))
+            index = array.array('H' if wide else 'B', f.read(runs * (2 if wide else 1)))
+            if sys.byteorder == 'big':
+                for values in (palette, lengths, index):
+                    values.byteswap()
+            if numpy is not None:
+                px = numpy.repeat(numpy.asarray(palette, numpy.uint32)[index], lengths)
+                if kind == DELTA:
+                    px ^= numpy.frombuffer(previous, numpy.uint32)
+                pixels = px.tobytes()
+            else:
+                out = array.array('I')
+                for color, run in zip(index, lengths):
+                    out.extend(itertools.repeat(palette[color], run))
+                if kind == DELTA:
+                    before = array.array('I')
+                    before.frombytes(previous)
+                    out = array.array('I', [a ^ b for a, b in zip(out, before)])
+                pixels = out.tobytes()
+            previous = pixels
+            yield (width, height), pixels
+
+
+class FrameCapture:
+    def __init__(self, path, like, pool=8, every=1, keyframe_every=60):
+        self.path = path
+        if path.endswith('.bkrl'):
+            self.format = 'rle'
+        elif path.endswith('.raw'):
+            self.format = 'raw'
+        else:
+            self.format = 'png'
+        self.size = like.get_size()
+        self.every = every
+        self.keyframe_every = keyframe_every
+        self.frame = 0
+        self.captured = 0
+        self.dropped = 0
+        self.written = 0
+        self.bytes = 0
+        # Set by the writer thread if it fails; capturing stops
+        self.error = None
+        # Buffers cycle free -> pending -> written -> free; nothing new is
+        # allocated per frame, and `pool` bounds the backlog
+        self.free = queue.SimpleQueue()
+        for _ in range(pool):
+            self.free.put(pygame.Surface(self.size, 0, like))
+        self.pending = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name='capture', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def capture(self, surface):
+        """Queue a copy of surface; drops the frame if no buffer is free"""
+        self.frame += 1
+        if self.frame % self.every or self.error is not None:
+            return
+        try:
+            buffer = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return
+        buffer.blit(surface, (0, 0))
+        self.pending.put((self.captured, buffer))
+        self.captured += 1
+
+    def stats(self):
+        return {'captured': self.captured, 'written': self.written,
+                'dropped': self.dropped, 'bytes': self.bytes, 'error': self.error}
+
+    def close(self):
+        if self._thread.is_alive():
+            self.pending.put(_STOP)
+            self._thread.join()
+            print(f"capture: {self.written} frames ({self.bytes // 1024} KiB) "
+                  f"to {self.path}, {self.dropped} dropped")
+
+    # Writer thread
+    def _run(self):
+        out = None
+        try:
+            out = self._open()
+            previous = None
+            while True:
+                item = self.pending.get()
+                if item is _STOP:
+                    break
+                number, buffer = item
+                try:
+                    previous = self._write(out, number, buffer, previous)
+                finally:
+                    self.free.put(buffer)
+        except Exception as exc:
+            self.error = exc
+            print(f"capture: stopped after {self.written} frames to {self.path}: {exc!r}",
+                  file=sys.stderr)
+        finally:
+            if out:
+                out.close()
+
+    def _open(self):
+        width, height = self.size
+        if self.format == 'png':
+            os.makedirs(self.path, exist_ok=True)
+            return None
+        out = open(self.path, 'wb')
+        if self.format == 'rle':
+            out.write(RLE_HEADER.pack(RLE_MAGIC, RLE_VERSION, width, height))
+        else:
+            out.write(RAW_HEADER.pack(RAW_MAGIC, width, height))
+        return out
+
+    def _write(self, out, number, buffer, previous):
+        """Write one frame; returns the pixels the next delta is taken against"""
+        if self.format == 'png':
+            name = os.path.join(self.path, f"{number:06d}.png")
+            pygame.image.save(buffer, name)
+            self.bytes += os.path.getsize(name)
+        else:
+            if self.format == 'rle':
+                pixels = pygame.image.tobytes(buffer, 'RGBX')
+                if self.written % self.keyframe_every == 0:
+                    previous = None
+                data = encode_rle(pixels, previous)
+                previous = pixels
+            else:
+                data = pygame.image.tobytes(buffer, 'RGB')
+            out.write(data)
+            self.bytes += len(data)
+        self.written += 1
+        return previous
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Decode a .bkrl capture to PNGs")
+    parser.add_argument('path')
+    parser.add_argument('out')
+    args = parser.parse_args()
+    os.makedirs(args.out, exist_ok=True)
+    count = 0
+    for count, (size, pixels) in enumerate(read_rle(args.path), 1):
+        frame = pygame.image.frombytes(pixels, size, 'RGBX')
+        pygame.image.save(frame, os.path.join(args.out, f"{count - 1:06d}.png"))
+    print(f"wrote {count} frames to {args.out}")
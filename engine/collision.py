@@ -0,0 +1,98 @@
+"""
+Batched ball-versus-brick collision.
+
+All bricks the ball overlaps this frame are gathered with one broadphase
+query and resolved together. Each brick is classified by the axis the ball
+crossed into it on: the axis along which the ball was still clear of it a
+frame earlier, or, when that doesn't decide it, the shallower penetration
+along the direction of travel. The ball reflects once on every axis some
+brick was entered on, so a ball grazing the seam between two bricks in a
+row bounces vertically once instead of once per brick, and a ball driven
+into an inner corner bounces on both axes. It is pushed back out by the
+deepest such penetration on each axis, which keeps fast balls from
+tunnelling on into the next row without sub-stepping.
+"""
+
+INF = float('inf')
+
+
+def penetration(rect, speed, area):
+    """(dx, dy) depth rect has travelled into area along its velocity"""
+    vx, vy = speed
+    if vx > 0:
+        dx = rect.right - area.left
+    elif vx < 0:
+        dx = area.right - rect.left
+    else:
+        dx = INF
+    if vy > 0:
+        dy = rect.bottom - area.top
+    elif vy < 0:
+        dy = area.bottom - rect.top
+    else:
+        dy = INF
+    return dx, dy
+
+
+def entry_axes(rect, speed, brick):
+    """(x, y) flags for the axes rect crossed into brick on, and the depths"""
+    dx, dy = penetration(rect, speed, brick)
+    if dx == dy == INF:
+        return False, False, dx, dy
+    # Where the rect was a frame ago
+    left = rect.left - speed[0]
+    top = rect.top - speed[1]
+    was_x = left < brick.right and left + rect.width > brick.left
+    was_y = top < brick.bottom and top + rect.height > brick.top
+    if was_x != was_y:
+        # Already overlapping on one axis, so it came in across the other
+        return was_y, was_x, dx, dy
+    return dx <= dy, dy <= dx, dx, dy
+
+
+def resolve(rect, speed, hits):
+    """Reflect speed off the hit rects and push rect clear.
+
+    `speed` is a mutable [vx, vy]. Returns (flipped_x, flipped_y); an inner
+    corner, or a corner hit with equal depths, flips both.
+    """
+    push_x = push_y = 0
+    for brick in hits:
+        on_x, on_y, dx, dy = entry_axes(rect, speed, brick)
+        if on_x:
+            push_x = max(push_x, dx)
+        if on_y:
+            push_y = max(push_y, dy)
+    flip_x = push_x > 0
+    flip_y = push_y > 0
+    if flip_x:
+        rect.x -= push_x if speed[0] > 0 else -push_x
+        speed[0] = -speed[0]
+    if flip_y:
+        rect.y -= push_y if speed[1] > 0 else -push_y
+        speed[1] = -speed[1]
+    return flip_x, flip_y
+
+
+def collide_bricks(ball, bricks):
+    """Bounce ball off every brick it overlaps and remove them all.
+
+    Returns the removed bricks so the caller can score them in one go.
+    """
+    hits = bricks.query(ball.rect)
+    if hits:
+        resolve(ball.rect, ball.speed, [brick.rect for brick in hits])
+        for brick in hits:
+            bricks.remove(brick)
+    return hits
+
+
+def paddle_bounce(ball, paddle, english):
+    """Send ball back up, angled by where it struck the paddle.
+
+    `english` is the horizontal speed given to a ball caught on the paddle's
+    very edge; a centred hit goes straight up.
+    """
+    offset = (ball.rect.centerx - paddle.rect.centerx) / (paddle.rect.width / 2)
+    ball.speed[0] = offset * english
+    ball.speed[1] = -abs(ball.speed[1])
@@ -0,0 +1,37 @@
+"""
+CRT overlay shared by the Famicom-style variants.
+
+Scanline and vignette layers are prebuilt once per resolution; the quality
+governor only switches between them, so apply() never rebuilds a Surface.
+"""
+
+import pygame
+
+SCANLINE_STEPS = (4, 8)
+
+
+class CRTEffect:
+    def __init__(self, size):
+        width, height = size
+        self.scanlines = {}
+        for step in SCANLINE_STEPS:
+            layer = pygame.Surface(size, pygame.SRCALPHA)
+            for y in range(0, height, step):
+                pygame.draw.line(layer, (0, 0, 0, 50), (0, y), (width, y))
+            self.scanlines[step] = layer
+
+        self.vignette = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.circle(self.vignette, (0, 0, 0, 90),
+                           (width//2, height//2), height//1.5, 200)
+        self.use_vignette = True
+        self.scanline_step = SCANLINE_STEPS[0]
+
+    def set_quality(self, vignette, scanline_step):
+        self.use_vignette = vignette
+        self.scanline_step = scanline_step
+
+    def apply(self, surface):
+        surface.blit(self.scanlines[self.scanline_step], (0, 0))
+        if self.use_vignette:
+            surface.blit(self.vignette, (0, 0))
+        return surface
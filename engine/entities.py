@@ -0,0 +1,155 @@
+"""
+Lightweight game entities.
+
+Plain __slots__ classes instead of pygame.sprite.Sprite: no per-instance
+__dict__, no group-membership dict and no private image Surface. Entities
+are solid rectangles, so drawing is a fill done by whoever renders them.
+"""
+
+import pygame
+
+# Below this many bricks one collidelistall over every rect beats walking
+# grid cells in Python (about 1.6 us against 2.1 us at 65 bricks)
+GRID_MIN_BRICKS = 128
+
+
+class Ball:
+    __slots__ = ('rect', 'color', 'speed', 'active', 'width')
+
+    def __init__(self, size, color, width, speed=(0, 0), center=None):
+        self.rect = pygame.Rect(0, 0, size, size)
+        if center:
+            self.rect.center = center
+        self.color = color
+        self.speed = list(speed)
+        self.active = False
+        # Right-hand wall the ball bounces off
+        self.width = width
+
+    def update(self):
+        if self.active:
+            self.rect.x += self.speed[0]
+            self.rect.y += self.speed[1]
+
+            # Wall collisions
+            if self.rect.left < 0:
+                self.speed[0] = abs(self.speed[0])
+            elif self.rect.right > self.width:
+                self.speed[0] = -abs(self.speed[0])
+            if self.rect.top < 0:
+                self.speed[1] = abs(self.speed[1])
+
+
+class Paddle:
+    __slots__ = ('rect', 'color', 'speed')
+
+    def __init__(self, width, height, color, center, speed):
+        self.rect = pygame.Rect(0, 0, width, height)
+        self.rect.center = center
+        self.color = color
+        self.speed = speed
+
+
+class Brick:
+    __slots__ = ('rect', 'color', 'group', 'index')
+
+    def __init__(self, x, y, width, height, color):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.color = color
+        self.group = None
+        self.index = -1
+
+    def kill(self):
+        if self.group is not None:
+            self.group.remove(self)
+
+
+class BrickSet:
+    """Unordered brick container with O(1) removal.
+
+    Rects are kept in a parallel list so collision queries run in C via
+    Rect.collidelist/collidelistall. Large sets can also be bucketed into a
+    uniform grid with index(), after which queries only visit nearby cells;
+    sets smaller than GRID_MIN_BRICKS stay flat.
+    """
+    __slots__ = ('bricks', 'rects', 'grid', 'cell')
+
+    def __init__(self, bricks=()):
+        self.bricks = []
+        self.rects = []
+        self.grid = None
+        self.cell = None
+        for brick in bricks:
+            self.add(brick)
+
+    def __len__(self):
+        return len(self.bricks)
+
+    def __iter__(self):
+        return iter(self.bricks)
+
+    def add(self, brick):
+        brick.group = self
+        brick.index = len(self.bricks)
+        self.bricks.append(brick)
+        self.rects.append(brick.rect)
+        if self.grid is not None:
+            for key in self._cells(brick.rect):
+                self.grid.setdefault(key, []).append(brick)
+
+    def remove(self, brick):
+        # Swap with the last brick so removal never shifts the list
+        index = brick.index
+        last = self.bricks.pop()
+        self.rects.pop()
+        if last is not brick:
+            self.bricks[index] = last
+            self.rects[index] = last.rect
+            last.index = index
+        if self.grid is not None:
+            for key in self._cells(brick.rect):
+                self.grid[key].remove(brick)
+        brick.group = None
+        brick.index = -1
+
+    def index(self, cell_w, cell_h, min_bricks=GRID_MIN_BRICKS):
+        """Bucket bricks into a cell_w x cell_h grid for query()"""
+        if len(self.bricks) < min_bricks:
+            self.grid = self.cell = None
+            return
+        self.cell = (cell_w, cell_h)
+        self.grid = {}
+        for brick in self.bricks:
+            for key in self._cells(brick.rect):
+                self.grid.setdefault(key, []).append(brick)
+
+    def _cells(self, rect):
+        cell_w, cell_h = self.cell
+        for gy in range(rect.top // cell_h, (rect.bottom - 1) // cell_h + 1):
+            for gx in range(rect.left // cell_w, (rect.right - 1) // cell_w + 1):
+                yield gx, gy
+
+    def query(self, rect):
+        """Every brick overlapping rect"""
+        if self.grid is None:
+            return self.collide_all(rect)
+        hits = []
+        for key in self._cells(rect):
+            for brick in self.grid.get(key, ()):
+                if brick.rect.colliderect(rect) and brick not in hits:
+                    hits.append(brick)
+        return hits
+
+    def collide_any(self, rect):
+        if self.grid is not None:
+            hits = self.query(rect)
+            return hits[0] if hits else None
+        index = rect.collidelist(self.rects)
+        return None if index == -1 else self.bricks[index]
+
+    def collide_all(self, rect):
+        return [self.bricks[i] for i in rect.collidelistall(self.rects)]
+
+    def draw(self, surface):
+        for brick in self.bricks:
+            surface.fill(brick.color, brick.rect)
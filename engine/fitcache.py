@@ -0,0 +1,115 @@
+"""
+Memoized genome fitness.
+
+Genomes are quantized to a per-parameter step before lookup, so settings the
+tuner keeps revisiting with tiny float differences share one entry. Entries
+are keyed by (quantized genome, seed), held in an LRU and optionally written
+through to SQLite so a tuning campaign can pick up where the last one
+stopped.
+"""
+
+import sqlite3
+from collections import OrderedDict
+
+# Resolution each genome parameter is compared at
+QUANT_STEPS = {
+    'ball_speed': 0.25,
+    'paddle_size': 4,
+    'brick_rows': 1,
+    'aggression': 0.05,
+    'chaos': 0.02,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fitness (
+    key TEXT PRIMARY KEY,
+    fitness REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+class FitnessCache:
+    def __init__(self, path=None, capacity=4096, steps=QUANT_STEPS, batch_size=64):
+        self.capacity = capacity
+        self.steps = steps
+        self.entries = OrderedDict()
+        self.db = None
+        if path:
+            self.db = sqlite3.connect(path)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.executescript(SCHEMA)
+        self.batch_size = batch_size
+        self.pending = []
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, genome, seed):
+        """Quantized (name, step count) tuple plus the seed"""
+        return tuple((name, round(genome[name] / self.steps.get(name, 1e-6)))
+                     for name in sorted(genome)) + (seed,)
+
+    def get(self, genome, seed):
+        """Cached fitness, or None"""
+        key = self.key(genome, seed)
+        fitness = self.entries.get(key)
+        if fitness is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return fitness
+        if self.db is not None:
+            row = self.db.execute("SELECT fitness FROM fitness WHERE key = ?",
+                                  (repr(key),)).fetchone()
+            if row is not None:
+                self.disk_hits += 1
+                self._insert(key, row[0])
+                return row[0]
+        self.misses += 1
+        return None
+
+    def put(self, genome, seed, fitness):
+        key = self.key(genome, seed)
+        self._insert(key, fitness)
+        if self.db is not None:
+            self.pending.append((repr(key), fitness))
+            if len(self.pending) >= self.batch_size:
+                self.flush()
+
+    def _insert(self, key, fitness):
+        self.entries[key] = fitness
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def evaluate(self, genome, seed, fn):
+        """fn(genome, seed) unless an equivalent run is already cached"""
+        fitness = self.get(genome, seed)
+        if fitness is None:
+            fitness = fn(genome, seed)
+            self.put(genome, seed, fitness)
+        return fitness
+
+    def flush(self):
+        if not self.pending:
+            return
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO fitness (key, fitness) VALUES (?, ?)",
+                self.pending)
+        self.pending.clear()
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {'hits': self.hits, 'disk_hits': self.disk_hits,
+                'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self.entries),
+                'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0}
+
+    def close(self):
+        if self.db is not None:
+            self.flush()
+            self.db.close()
+            self.db = None
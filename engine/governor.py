@@ -0,0 +1,88 @@
+"""
+Adaptive quality governor.
+
+Watches rolling frame work times and sheds effects one level at a time when
+the frame budget is at risk, restoring them once there is headroom again.
+Shedding reacts within a second; restoring waits several seconds, so the
+level does not oscillate around the threshold.
+"""
+
+from collections import deque
+
+import pygame
+
+# Each level keeps everything the previous one shed
+QUALITY_LEVELS = [
+    {'vignette': True, 'scanline_step': 4, 'hud_interval': 1, 'mixer_channels': 8},
+    {'vignette': False, 'scanline_step': 4, 'hud_interval': 1, 'mixer_channels': 8},
+    {'vignette': False, 'scanline_step': 8, 'hud_interval': 1, 'mixer_channels': 8},
+    {'vignette': False, 'scanline_step': 8, 'hud_interval': 6, 'mixer_channels': 8},
+    {'vignette': False, 'scanline_step': 8, 'hud_interval': 6, 'mixer_channels': 2},
+]
+
+
+class QualityGovernor:
+    def __init__(self, fps=60, adaptive=True, window=60,
+                 shed_at=0.85, restore_at=0.5, shed_hold=60, restore_hold=300):
+        self.budget_ms = 1000 / fps
+        self.adaptive = adaptive
+        self.samples = deque(maxlen=window)
+        self.shed_at = shed_at
+        self.restore_at = restore_at
+        self.shed_hold = shed_hold
+        self.restore_hold = restore_hold
+        self.level = 0
+        self.frame = 0
+        self.last_change = 0
+        self.changes = 0
+
+    @property
+    def settings(self):
+        return QUALITY_LEVELS[self.level]
+
+    def average_ms(self):
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    def tick(self, frame_ms):
+        """Record one frame's work time; True when the level changed"""
+        self.frame += 1
+        self.samples.append(frame_ms)
+        if not self.adaptive or len(self.samples) < self.samples.maxlen:
+            return False
+
+        held = self.frame - self.last_change
+        load = self.average_ms() / self.budget_ms
+        if load > self.shed_at and held >= self.shed_hold:
+            step = 1
+        elif load < self.restore_at and held >= self.restore_hold:
+            step = -1
+        else:
+            return False
+
+        level = max(0, min(len(QUALITY_LEVELS) - 1, self.level + step))
+        if level == self.level:
+            return False
+        self.level = level
+        self.last_change = self.frame
+        self.changes += 1
+        self.samples.clear()
+        return True
+
+    def apply(self, crt=None):
+        """Push the current level into the CRT overlay and the mixer"""
+        settings = self.settings
+        if crt:
+            crt.set_quality(settings['vignette'], settings['scanline_step'])
+        if pygame.mixer.get_init():
+            pygame.mixer.set_num_channels(settings['mixer_channels'])
+
+    def refresh_hud(self):
+        """Whether HUD text should be re-rendered this frame"""
+        return self.frame % self.settings['hud_interval'] == 0
+
+    def stats(self):
+        return {
+            'quality': self.level,
+            'frame_ms': round(self.average_ms(), 3),
+            'quality_changes': self.changes,
+        }
@@ -0,0 +1,141 @@
+"""
+Game host shared by the 384x288 variants.
+
+A variant describes itself with a Config subclass (resolution, pacing,
+effects, score store, autopilot...) and keeps only its own rules. Host
+builds the window, render queue and services that config asks for, and
+wraps each frame with the allocation phases, the quality governor and
+the frame pacer.
+"""
+
+import time
+
+import pygame
+
+from . import assets
+from .alloctrace import AllocTracker
+from .audio import SoundEngine
+from .autopilot import Autopilot
+from .governor import QualityGovernor
+from .levelpack import LevelBuilder
+from .pacing import FramePacer
+from .particles import ParticleSystem
+from .playfield import PlayField
+from .prefetch import LevelPrefetcher
+from .renderqueue import RenderQueue
+from .scaler import ScaledDisplay
+from .scoredb import ScoreDB
+from .spectator import SpectatorServer
+
+
+class Config:
+    """Defaults; a variant subclasses this and overrides what differs"""
+    VARIANT = None  # name its scores are recorded under
+    CAPTION = None
+    WIDTH, HEIGHT = 384, 288
+    PADDLE_W, PADDLE_H = 64, 10
+    BALL_SIZE = 8
+    BRICK_COLS = 12
+    FPS = 60
+    PACING = 'sleep'  # sleep, busy, hybrid or vsync
+    PACE_STATS = False  # print frame jitter statistics at exit
+    CAPTURE = None  # record to a .bkrl/.raw file or a PNG directory
+    CRT_EFFECT = True
+    PARTICLES = True  # brick-break fragments; needs numpy
+    ADAPTIVE_QUALITY = True
+    SCORE_DB = 'breakout.db'  # None to keep no scores
+    AUTOPILOT = None  # skill 0-1 to let the autopilot play
+    LEVEL_PACK = None  # path to a .bkpk file; None for random layouts
+    LEVEL_SEED = None  # fixes the random layouts; None for a new seed each run
+    ALLOC_TRACE = False
+    SPECTATOR_PORT = None  # e.g. 8765 to stream to `python -m engine.spectator` viewers
+    SOUNDS = ('hit', 'break', 'death', 'start')
+    FONT_SIZE = 24
+
+    COLORS = {
+        'bg': (16, 16, 24),
+        'paddle': (255, 255, 255),
+        'ball': (255, 213, 0),
+        'bricks': [
+            (228, 0, 0), (255, 145, 0), (255, 228, 0),
+            (0, 228, 0), (0, 145, 228), (180, 0, 228)
+        ],
+        'text': (200, 200, 200)
+    }
+
+
+class Host:
+    def __init__(self, config):
+        self.config = c = config
+        size = (c.WIDTH, c.HEIGHT)
+        self.display = ScaledDisplay(size, vsync=c.PACING == 'vsync', capture=c.CAPTURE)
+        if c.CAPTION:
+            pygame.display.set_caption(c.CAPTION)
+        self.screen = self.display.surface
+        self.queue = RenderQueue(self.screen)
+        self.crt = assets.crt(size) if c.CRT_EFFECT else None
+        self.particles = ParticleSystem(self.screen) if c.PARTICLES else None
+        self.governor = QualityGovernor(c.FPS, adaptive=c.ADAPTIVE_QUALITY)
+        self.pacer = FramePacer(c.FPS, c.PACING, self.display.vsync,
+                                report_at_exit=c.PACE_STATS)
+        self.sound = SoundEngine(c.SOUNDS)
+        self.font = assets.font(c.FONT_SIZE)
+        self.scores = ScoreDB(c.SCORE_DB) if c.SCORE_DB else None
+        self.pilot = Autopilot(c.WIDTH, c.AUTOPILOT) if c.AUTOPILOT is not None else None
+        self.tracker = AllocTracker() if c.ALLOC_TRACE else None
+        self.spectator = (SpectatorServer(size, port=c.SPECTATOR_PORT)
+                          if c.SPECTATOR_PORT else None)
+        levels = assets.level_pack(c.LEVEL_PACK) if c.LEVEL_PACK else None
+        build = LevelBuilder(c.WIDTH, c.BRICK_COLS, c.COLORS['bricks'], levels)
+        self.prefetch = LevelPrefetcher(build, c.LEVEL_SEED,
+                                        self.tracker.timing if self.tracker else None)
+        self.frame_start = None
+
+    def play_field(self, on_game_over=None):
+        """Single-ball PlayField laid out by the config"""
+        c = self.config
+        return PlayField((c.WIDTH, c.HEIGHT), c.COLORS, self.prefetch, self.sound,
+                         self.particles, (c.PADDLE_W, c.PADDLE_H), 8, c.BALL_SIZE,
+                         on_game_over)
+
+    def begin_frame(self):
+        self.frame_start = time.perf_counter()
+        self.phase('input')
+
+    def phase(self, name):
+        if self.tracker:
+            self.tracker.phase(name)
+
+    def publish(self, field):
+        if self.spectator:
+            self.spectator.publish(field.bricks, field.ball.rect, field.paddle.rect,
+                                   field.score, field.lives, field.level)
+
+    def record(self, score, level, started):
+        if self.scores:
+            self.scores.record_session(self.config.VARIANT, score, level, started)
+
+    def present(self):
+        """CRT pass and flip of the finished frame"""
+        if self.crt:
+            self.crt.apply(self.screen)
+        self.phase('present')
+        self.display.present()
+
+    def end_frame(self):
+        """Feed the frame's cost to the governor and wait for the next one"""
+        if self.tracker:
+            self.tracker.end_frame()
+        # Vsync waits in the flip aren't load
+        work_ms = (time.perf_counter() - self.frame_start) * 1000 - self.display.blocked_ms
+        if self.governor.tick(work_ms):
+            self.governor.apply(self.crt)
+        self.pacer.pace()
+
+    def close(self):
+        if self.scores:
+            self.scores.close()
+        self.prefetch.close()
+        if self.spectator:
+            self.spectator.close()
+        pygame.quit()
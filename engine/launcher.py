@@ -0,0 +1,44 @@
+"""
+Variant launcher.
+
+The table below is all the launcher knows about a variant until it is
+picked, so listing them starts neither pygame nor the mixer, and running
+one imports only that variant's module and the engine parts it uses.
+"""
+
+import argparse
+import importlib
+import sys
+
+# name -> (module, description)
+VARIANTS = {
+    'retro': ('engine.variants.retro', "Famicom-style Breakout with CRT, levels and high scores"),
+    'states': ('engine.variants.states', "Retro Breakout with menu, scores and credits screens"),
+    'evo': ('engine.variants.evo', "Self-tuning Breakout Evo; --tune ROUNDS to tune headlessly"),
+    'multiball': ('engine.variants.multiball', "Multi-ball build with chiptune music"),
+    'classic': ('engine.variants.classic', "Minimal 256x224 Breakout"),
+    'tournament': ('engine.variants.tournament', "Split-screen autopilot tournament"),
+}
+
+
+def load(name):
+    module, _ = VARIANTS[name]
+    return importlib.import_module(module)
+
+
+def main(variant=None, argv=None):
+    """Run `variant` with argv, or pick it from the command line"""
+    argv = sys.argv[1:] if argv is None else argv
+    if variant is None:
+        parser = argparse.ArgumentParser(prog='python -m engine',
+                                         description="Run a Breakout variant")
+        parser.add_argument('variant', nargs='?', choices=VARIANTS)
+        parser.add_argument('args', nargs=argparse.REMAINDER,
+                            help="passed on to the variant")
+        args = parser.parse_args(argv)
+        if args.variant is None:
+            for name, (_, description) in VARIANTS.items():
+                print(f"{name:<12}{description}")
+            return
+        variant, argv = args.variant, args.args
+    return load(variant).main(argv)
@@ -0,0 +1,202 @@
+"""
+Binary level packs, read lazily through mmap.
+
+Layout (little-endian):
+
+    header   magic b'BKPK', version u16, reserved u16, count u32, table u64
+    records  per level: rows u8, cols u8,
+             brick bitmap (rows*cols bits, row-major, LSB first),
+             palette indices (4 bits per present brick, low nibble first)
+    table    count x u32 record offsets
+
+Opening a pack only maps the file and reads the header; indexing a level
+reads one table entry and that level's record.
+
+    python -m engine.levelpack levels.bkpk 100000 --rows 8 --cols 12
+"""
+
+import argparse
+import array
+import mmap
+import sys
+import random
+import struct
+
+from .entities import Brick, BrickSet
+
+MAGIC = b'BKPK'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIQ')
+OFFSET = struct.Struct('<I')
+
+
+class Level:
+    __slots__ = ('rows', 'cols', 'cells')
+
+    def __init__(self, rows, cols, cells):
+        self.rows = rows
+        self.cols = cols
+        # [(row, col, palette_index)] for every present brick
+        self.cells = cells
+
+
+def random_level(rows, cols, density=0.7, palette_size=6, rng=random):
+    cells = []
+    for row in range(rows):
+        for col in range(cols):
+            if rng.random() < density:
+                cells.append((row, col, rng.randrange(palette_size)))
+    return Level(rows, cols, cells)
+
+
+def build_bricks(level, origin, pitch, size, palette):
+    """BrickSet for a level laid out on a (pitch) grid starting at origin"""
+    x0, y0 = origin
+    pitch_x, pitch_y = pitch
+    width, height = size
+    return BrickSet(
+        Brick(x0 + col * pitch_x, y0 + row * pitch_y, width, height,
+              palette[index % len(palette)])
+        for row, col, index in level.cells)
+
+
+class LevelBuilder:
+    """Level number -> indexed BrickSet, shaped for LevelPrefetcher.
+
+    Levels come from a pack when one is given (wrapping around at its end),
+    otherwise they are random layouts that gain a row per level. A pack
+    level's columns are spread across the full width whatever its column
+    count. Pack levels that can't fit (more than max_rows rows, which would
+    reach down to the paddle, or too many columns for a brick to stay at
+    least a pixel wide) are found once up front and skipped.
+    """
+    def __init__(self, width, cols, palette, levels=None, top=40, row_height=16,
+                 gap=2, max_rows=8):
+        self.width = width
+        self.cols = cols
+        self.palette = palette
+        self.levels = levels
+        self.top = top
+        self.row_height = row_height
+        self.gap = gap
+        self.max_rows = max_rows
+        self.playable = None
+        if levels is not None:
+            self.playable = array.array('I', (
+                i for i in range(len(levels)) if self.fits(*levels.shape(i))))
+            if not self.playable:
+                raise ValueError("no level in the pack fits the screen")
+            skipped = len(levels) - len(self.playable)
+            if skipped:
+                print(f"levelpack: skipping {skipped} of {len(levels)} levels "
+                      f"that don't fit", file=sys.stderr)
+
+    def fits(self, rows, cols):
+        return 1 <= cols <= self.width // (self.gap + 1) and rows <= self.max_rows
+
+    def __call__(self, number, rng=random):
+        if self.levels:
+            level = self.levels[self.playable[(number - 1) % len(self.playable)]]
+        else:
+            level = random_level(min(3 + number, self.max_rows), self.cols, 0.7,
+                                 len(self.palette), rng)
+        pitch = (self.width // level.cols, self.row_height)
+        size = (pitch[0] - self.gap, self.row_height - self.gap)
+        bricks = build_bricks(level, (1, self.top), pitch, size, self.palette)
+        bricks.index(*pitch)
+        return bricks
+
+
+def encode_level(level):
+    bitmap = bytearray((level.rows * level.cols + 7) // 8)
+    colors = bytearray((len(level.cells) + 1) // 2)
+    for i, (row, col, index) in enumerate(sorted(level.cells)):
+        bit = row * level.cols + col
+        bitmap[bit >> 3] |= 1 << (bit & 7)
+        colors[i >> 1] |= (index & 0xF) << (4 * (i & 1))
+    return bytes((level.rows, level.cols)) + bitmap + colors
+
+
+def decode_level(buf, offset):
+    rows, cols = buf[offset], buf[offset + 1]
+    start = offset + 2
+    bitmap = buf[start:start + (rows * cols + 7) // 8]
+    colors = start + len(bitmap)
+    cells = []
+    for bit in range(rows * cols):
+        if bitmap[bit >> 3] >> (bit & 7) & 1:
+            i = len(cells)
+            index = buf[colors + (i >> 1)] >> (4 * (i & 1)) & 0xF
+            cells.append((bit // cols, bit % cols, index))
+    return Level(rows, cols, cells)
+
+
+def write_pack(path, levels):
+    """Stream levels to a pack file; returns the level count"""
+    offsets = []
+    with open(path, 'wb') as f:
+        f.write(bytes(HEADER.size))
+        for level in levels:
+            offsets.append(f.tell())
+            f.write(encode_level(level))
+        if f.tell() > 0xFFFFFFFF:
+            raise ValueError("level pack larger than 4 GiB")
+        table = f.tell()
+        f.write(b''.join(OFFSET.pack(offset) for offset in offsets))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(offsets), table))
+    return len(offsets)
+
+
+class LevelPack:
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.count, self.table = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} level pack")
+
+    def __len__(self):
+        return self.count
+
+    def _offset(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return OFFSET.unpack_from(self._map, self.table + index * OFFSET.size)[0]
+
+    def __getitem__(self, index):
+        return decode_level(self._map, self._offset(index))
+
+    def shape(self, index):
+        """(rows, cols) of a level without decoding it"""
+        offset = self._offset(index)
+        return self._map[offset], self._map[offset + 1]
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a random level pack")
+    parser.add_argument('path')
+    parser.add_argument('count', type=int)
+    parser.add_argument('--rows', type=int, default=8)
+    parser.add_argument('--cols', type=int, default=12)
+    parser.add_argument('--density', type=float, default=0.7)
+    parser.add_argument('--palette', type=int, default=6)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    count = write_pack(args.path, (
+        random_level(min(4 + i % args.rows, args.rows), args.cols,
+                     args.density, args.palette, rng)
+        for i in range(args.count)))
+    print(f"wrote {count} levels to {args.path}")
@@ -0,0 +1,121 @@
+"""
+Frame pacing with jitter statistics.
+
+`pace()` is called once per frame, right after the frame is presented, and
+waits out the rest of the frame period using one of:
+
+    sleep    pygame Clock.tick: cheap, millisecond granularity
+    busy     Clock.tick_busy_loop: precise, burns a core
+    hybrid   sleep until spin_ms before the deadline, then spin
+    vsync    no wait; the flip already blocked on the display refresh
+
+Every frame interval is binned by its distance from the target period, so
+p50/p95/p99 jitter and missed deadlines can be compared against the time
+spent waiting (CPU burn) for each mode on a given machine.
+"""
+
+import atexit
+import time
+
+import pygame
+
+MODES = ('sleep', 'busy', 'hybrid', 'vsync')
+# Frames observed before trusting that the flip really waits for vsync
+VSYNC_PROBE = 60
+
+
+class FramePacer:
+    def __init__(self, fps=60, mode='sleep', vsync=False, spin_ms=2.0,
+                 bucket_ms=0.1, max_ms=50.0, report_at_exit=False):
+        if mode not in MODES:
+            raise ValueError(f"unknown pacing mode {mode!r}")
+        if mode == 'vsync' and not vsync:
+            # The display couldn't give us vsync; don't run uncapped
+            mode = 'hybrid'
+        self.fps = fps
+        self.mode = mode
+        self.period = 1 / fps
+        self.spin = spin_ms / 1000
+        self.clock = pygame.time.Clock()
+        self.deadline = None
+        self.last = None
+        self.interval_ms = self.period * 1000
+        # Jitter histogram; the last bucket collects everything beyond max_ms
+        self.bucket_ms = bucket_ms
+        self.histogram = [0] * (int(max_ms / bucket_ms) + 1)
+        self.frames = 0
+        self.missed = 0
+        self.wait = 0.0
+        self.elapsed = 0.0
+        if report_at_exit:
+            atexit.register(self.print_report)
+
+    def pace(self):
+        """Wait for the next frame; returns the last frame interval in ms"""
+        start = time.perf_counter()
+        if self.mode == 'sleep':
+            self.clock.tick(self.fps)
+        elif self.mode == 'busy':
+            self.clock.tick_busy_loop(self.fps)
+        elif self.mode == 'hybrid':
+            self._hybrid(start)
+        now = time.perf_counter()
+        self.wait += now - start
+        if self.last is not None:
+            self._record(now - self.last)
+        self.last = now
+        return self.interval_ms
+
+    def _hybrid(self, now):
+        deadline = now if self.deadline is None else self.deadline + self.period
+        # A late frame resets the schedule instead of rushing to catch up
+        deadline = max(deadline, now)
+        remaining = deadline - now - self.spin
+        if remaining > 0:
+            time.sleep(remaining)
+        while time.perf_counter() < deadline:
+            pass
+        self.deadline = deadline
+
+    def _record(self, interval):
+        self.interval_ms = interval * 1000
+        jitter = abs(self.interval_ms - self.period * 1000)
+        bucket = min(int(jitter / self.bucket_ms), len(self.histogram) - 1)
+        self.histogram[bucket] += 1
+        self.frames += 1
+        self.elapsed += interval
+        if interval > self.period * 1.5:
+            self.missed += 1
+        if (self.mode == 'vsync' and self.frames == VSYNC_PROBE
+                and self.elapsed < VSYNC_PROBE * self.period * 0.75):
+            # Some drivers accept the vsync flag but never block (or refresh
+            # far faster than fps); pace ourselves instead
+            self.mode = 'hybrid'
+
+    def percentile(self, p):
+        """Upper edge (ms) of the bucket holding the p-th jitter percentile"""
+        if not self.frames:
+            return 0.0
+        target = p / 100 * self.frames
+        seen = 0
+        for bucket, count in enumerate(self.histogram):
+            seen += count
+            if seen >= target:
+                return (bucket + 1) * self.bucket_ms
+        return len(self.histogram) * self.bucket_ms
+
+    def stats(self):
+        n = self.frames or 1
+        return {'mode': self.mode, 'frames': self.frames, 'missed': self.missed,
+                'p50': self.percentile(50), 'p95': self.percentile(95),
+                'p99': self.percentile(99), 'wait_ms': self.wait / n * 1000}
+
+    def report(self):
+        s = self.stats()
+        return (f"Pacing ({s['mode']}, {self.fps} fps): {s['frames']} frames, "
+                f"{s['missed']} missed\n"
+                f"jitter p50 {s['p50']:.1f} ms  p95 {s['p95']:.1f} ms  "
+                f"p99 {s['p99']:.1f} ms  wait {s['wait_ms']:.2f} ms/frame")
+
+    def print_report(self):
+        print(self.report())
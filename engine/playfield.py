@@ -0,0 +1,139 @@
+"""
+Single-ball Breakout play field shared by the retro variants.
+
+Owns the paddle, ball, bricks, score, lives and level, the rules that move
+them and the cached score/lives HUD. The host variant supplies the level
+prefetcher, sounds, optional particles and the input, and decides what
+happens around a game: retro shows its game-over text on top of the field,
+the state machine switches to its game-over screen.
+"""
+
+import random
+import time
+
+import pygame
+from pygame.locals import K_LEFT, K_RIGHT
+
+from .collision import collide_bricks, paddle_bounce
+from .entities import Ball, Paddle
+
+
+class PlayField:
+    def __init__(self, size, colors, prefetch, sound, particles=None,
+                 paddle_size=(64, 10), paddle_speed=8, ball_size=8, on_game_over=None):
+        self.width, self.height = size
+        self.colors = colors
+        self.prefetch = prefetch
+        self.sound = sound
+        self.particles = particles
+        self.paddle_size = paddle_size
+        self.paddle_speed = paddle_speed
+        self.ball_size = ball_size
+        # on_game_over(field) runs once the last life is lost
+        self.on_game_over = on_game_over
+        self.hud = None
+        self.reset()
+
+    def reset(self):
+        width, height = self.width, self.height
+        self.paddle = Paddle(*self.paddle_size, self.colors['paddle'],
+                             (width//2, height-30), self.paddle_speed)
+        self.ball = Ball(self.ball_size, self.colors['ball'], width)
+        self.ball.rect.center = (width//2, height//2)
+        self.lives = 3
+        self.score = 0
+        self.level = 1
+        self.started = time.time()
+        self.bricks = self.prefetch.take(self.level)
+        self.game_over = False
+        if self.particles:
+            self.particles.clear()
+
+    @property
+    def serving(self):
+        """Waiting for the player to launch the ball"""
+        return not self.ball.active and not self.game_over
+
+    def serve(self):
+        if self.serving:
+            self.ball.active = True
+            self.ball.speed = [random.choice([-5, 5]), -5]
+            self.sound.sfx['start'].play()
+
+    def move_paddle(self, keys):
+        if keys[K_LEFT]:
+            self.paddle.rect.x -= self.paddle.speed
+        if keys[K_RIGHT]:
+            self.paddle.rect.x += self.paddle.speed
+        self.paddle.rect.clamp_ip(pygame.Rect(0, 0, self.width, self.height))
+
+    def update(self):
+        if self.particles:
+            self.particles.update()
+        if self.game_over:
+            return
+
+        self.ball.update()
+
+        if self.ball.rect.colliderect(self.paddle.rect):
+            paddle_bounce(self.ball, self.paddle, 7)
+            self.sound.sfx['hit'].play()
+
+        # Bricks are removed and the ball reflected in one batch
+        hits = collide_bricks(self.ball, self.bricks)
+        if hits:
+            self.score += 10 * len(hits)
+            if self.particles:
+                for brick in hits:
+                    self.particles.emit(brick.rect, brick.color)
+            self.sound.sfx['break'].play()
+
+        if self.ball.rect.bottom > self.height:
+            self.lose_ball()
+
+        if len(self.bricks) == 0:
+            self.level_up()
+
+    def lose_ball(self):
+        self.lives -= 1
+        self.sound.sfx['death'].play()
+        if self.lives <= 0:
+            self.game_over = True
+            # A restart begins at level 1 again; have it ready
+            self.prefetch.prefetch(1)
+            if self.on_game_over:
+                self.on_game_over(self)
+        else:
+            self.recenter()
+
+    def level_up(self):
+        self.level += 1
+        self.ball.speed[0] *= 1.1
+        self.ball.speed[1] *= 1.1
+        # Built in the background while the previous level was played
+        self.bricks = self.prefetch.take(self.level)
+        self.recenter()
+
+    def recenter(self):
+        self.ball.active = False
+        self.ball.rect.center = (self.width//2, self.height//2)
+        self.paddle.rect.center = (self.width//2, self.height-30)
+
+    def draw(self, queue, font, refresh_hud=True):
+        """Queue the field and HUD, then flush queue and particles"""
+        queue.fill_all(self.bricks)
+        queue.fill(self.paddle.color, self.paddle.rect)
+        queue.fill(self.ball.color, self.ball.rect)
+
+        if self.hud is None or (refresh_hud and
+                (self.hud_score != self.score or self.hud_lives != self.lives)):
+            self.hud_score, self.hud_lives = self.score, self.lives
+            self.hud = (
+                font.render(f"Score: {self.score}", True, self.colors['text']),
+                font.render(f"Lives: {self.lives}", True, self.colors['text'])
+            )
+        queue.blit(self.hud[0], (10, 10), 1)
+        queue.blit(self.hud[1], (self.width - 100, 10), 1)
+        queue.flush()
+        if self.particles:
+            self.particles.draw()
@@ -0,0 +1,69 @@
+"""
+Seeded background level pipeline.
+
+Level N+1 is built on a worker thread while level N is played, so the
+transition at level completion only swaps in an already-finished result.
+Each level gets its own Random seeded from (seed, level), which keeps the
+layouts reproducible no matter which thread builds them or in what order.
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class LevelPrefetcher:
+    def __init__(self, build, seed=None, report=None):
+        # build(level, rng) -> prepared level (bricks, spatial index, ...)
+        self.build = build
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        # report(name, ms) receives generation and stall timings
+        self.report = report
+        self.pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+        self.pending = {}
+        self.built = 0
+        self.gen_ms = 0.0
+        self.max_gen_ms = 0.0
+        self.stalls = 0
+        self.wait_ms = 0.0
+
+    def _build(self, level):
+        start = time.perf_counter()
+        result = self.build(level, random.Random(self.seed * 1_000_003 + level))
+        return result, (time.perf_counter() - start) * 1000
+
+    def prefetch(self, level):
+        if level not in self.pending:
+            self.pending[level] = self.pool.submit(self._build, level)
+
+    def take(self, level):
+        """Prepared result for `level`; queues level+1 behind it"""
+        future = self.pending.pop(level, None)
+        if future is None:
+            future = self.pool.submit(self._build, level)
+        start = time.perf_counter()
+        if not future.done():
+            self.stalls += 1
+        result, gen_ms = future.result()
+        wait_ms = (time.perf_counter() - start) * 1000
+        self.built += 1
+        self.gen_ms += gen_ms
+        self.max_gen_ms = max(self.max_gen_ms, gen_ms)
+        self.wait_ms += wait_ms
+        if self.report:
+            self.report('level_gen', gen_ms)
+            self.report('level_wait', wait_ms)
+        # Anything else queued (skipped levels, an abandoned game) is stale
+        for stale in [n for n in self.pending if n != level + 1]:
+            self.pending.pop(stale).cancel()
+        self.prefetch(level + 1)
+        return result
+
+    def stats(self):
+        n = self.built or 1
+        return {'built': self.built, 'avg_gen_ms': self.gen_ms / n,
+                'max_gen_ms': self.max_gen_ms, 'stalls': self.stalls,
+                'wait_ms': self.wait_ms}
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,65 @@
+"""
+Per-frame render queue submitted with a single Surface.blits call.
+
+Draw commands are collected by layer during the frame and flushed once.
+Within a layer they are sorted by source surface so consecutive blits
+share a source. Solid rectangles are turned into blits of cached solid
+surfaces (one per colour and size), which lets a whole brick wall, the
+paddle, the ball and the HUD go down in one C call instead of one Python
+call per rectangle. Queues drawing into same-format surfaces (e.g. tiles
+of one display) can share a single solids cache.
+"""
+
+import pygame
+
+
+def _source_id(item):
+    return id(item[0])
+
+
+class RenderQueue:
+    def __init__(self, target, solids=None):
+        self.target = target
+        self.layers = {}
+        self.solids = {} if solids is None else solids
+        # Reused every flush so a steady frame allocates nothing new
+        self.batch = []
+
+    def _solid(self, color, size):
+        key = (color, size)
+        solid = self.solids.get(key)
+        if solid is None:
+            solid = self.solids[key] = pygame.Surface(size, 0, self.target)
+            solid.fill(color)
+        return solid
+
+    def _layer(self, layer):
+        items = self.layers.get(layer)
+        if items is None:
+            items = self.layers[layer] = []
+        return items
+
+    def blit(self, source, dest, layer=0):
+        self._layer(layer).append((source, dest))
+
+    def fill(self, color, rect, layer=0):
+        self._layer(layer).append((self._solid(color, rect.size), rect))
+
+    def fill_all(self, entities, layer=0):
+        """Queue a fill for every object with .color and .rect"""
+        items = self._layer(layer)
+        solid = self._solid
+        for entity in entities:
+            rect = entity.rect
+            items.append((solid(entity.color, rect.size), rect))
+
+    def flush(self):
+        batch = self.batch
+        for layer in sorted(self.layers):
+            items = self.layers[layer]
+            items.sort(key=_source_id)
+            batch.extend(items)
+            items.clear()
+        if batch:
+            self.target.blits(batch, doreturn=False)
+            batch.clear()
@@ -0,0 +1,94 @@
+"""
+Native-resolution back buffer with integer-scaled presentation.
+
+Games draw into `ScaledDisplay.surface` at Famicom resolution; `present()`
+scales it once per frame into the cached window surface and flips. With
+vsync=True the window is opened with SDL's own SCALED renderer instead,
+which is the only way pygame offers vsync; the flip then blocks on the
+display refresh, and `blocked_ms` says for how long, so frame timing can
+leave the wait out. Passing a capture path records every presented frame
+through a background FrameCapture.
+"""
+
+import time
+
+import pygame
+
+from .capture import FrameCapture
+
+try:
+    import numpy
+    import pygame.surfarray
+except ImportError:
+    numpy = None
+
+MAX_SCALE = 6
+
+
+def fit_scale(size, margin=64):
+    """Largest integer scale that fits the desktop"""
+    try:
+        desk_w, desk_h = pygame.display.get_desktop_sizes()[0]
+    except (pygame.error, IndexError):
+        return 1
+    scale = min((desk_w - margin) // size[0], (desk_h - margin) // size[1])
+    return max(1, min(MAX_SCALE, scale))
+
+
+class ScaledDisplay:
+    def __init__(self, size, scale=None, method='scale', vsync=False, capture=None):
+        self.size = size
+        self.vsync = False
+        self.blocked_ms = 0.0
+        if vsync:
+            try:
+                self.window = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+                self.vsync = True
+            except pygame.error:
+                pass
+        if self.vsync:
+            # SDL scales on the GPU; we draw straight into the window
+            self.scale = 1
+            self.window_size = size
+        else:
+            self.scale = scale or fit_scale(size)
+            self.window_size = (size[0] * self.scale, size[1] * self.scale)
+            self.window = pygame.display.set_mode(self.window_size)
+        # Same pixel format as the window so the scale never converts
+        self.surface = pygame.Surface(size, 0, self.window)
+        if method == 'numpy' and (numpy is None or self.window.get_bytesize() != 4):
+            method = 'scale'
+        self.method = method
+        if self.scale == 1:
+            self.surface = self.window
+        elif method == 'numpy':
+            # Nearest-neighbour index maps, computed once
+            self._cols = numpy.arange(self.window_size[0]) // self.scale
+            self._rows = numpy.arange(self.window_size[1]) // self.scale
+            self._stretch = numpy.empty((self.window_size[0], size[1]),
+                                        dtype=numpy.uint32)
+        self.recorder = FrameCapture(capture, self.surface) if capture else None
+
+    def window_pos(self, pos):
+        """Map a window coordinate (e.g. mouse) back to native pixels"""
+        return (pos[0] // self.scale, pos[1] // self.scale)
+
+    def present(self):
+        if self.recorder:
+            self.recorder.capture(self.surface)
+        if self.scale == 1:
+            pass
+        elif self.method == 'numpy':
+            src = pygame.surfarray.pixels2d(self.surface)
+            dst = pygame.surfarray.pixels2d(self.window)
+            numpy.take(src, self._cols, axis=0, out=self._stretch, mode='clip')
+            numpy.take(self._stretch, self._rows, axis=1, out=dst, mode='clip')
+            del src, dst
+        else:
+            pygame.transform.scale(self.surface, self.window_size, self.window)
+        if self.vsync:
+            start = time.perf_counter()
+            pygame.display.flip()
+            self.blocked_ms = (time.perf_counter() - start) * 1000
+        else:
+            pygame.display.flip()
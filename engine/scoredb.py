@@ -0,0 +1,168 @@
+"""
+SQLite high-score and session store.
+
+Sessions are buffered and written in one transaction per batch, or after
+`flush_interval` seconds, and at exit. Genomes are grouped by their values
+quantized to fitcache.QUANT_STEPS (the exact snapshot is kept on the
+session row), and per-genome totals are maintained incrementally with an
+upsert, so leaderboard and aggregate queries read a handful of index
+entries no matter how many sessions have been recorded.
+"""
+
+import atexit
+import json
+import sqlite3
+import time
+
+from .fitcache import QUANT_STEPS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS genomes (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    variant TEXT NOT NULL,
+    started REAL NOT NULL,
+    ended REAL NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    genome_id INTEGER REFERENCES genomes(id),
+    genome TEXT
+);
+CREATE INDEX IF NOT EXISTS sessions_leaderboard
+    ON sessions (variant, score DESC, level DESC);
+CREATE INDEX IF NOT EXISTS sessions_score ON sessions (score DESC, level DESC);
+CREATE TABLE IF NOT EXISTS genome_totals (
+    genome_id INTEGER PRIMARY KEY REFERENCES genomes(id),
+    sessions INTEGER NOT NULL,
+    total_score INTEGER NOT NULL,
+    best_score INTEGER NOT NULL,
+    best_level INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS genome_totals_best ON genome_totals (best_score DESC);
+"""
+
+INSERT_GENOME = "INSERT OR IGNORE INTO genomes (key) VALUES (?)"
+SELECT_GENOME = "SELECT id FROM genomes WHERE key = ?"
+INSERT_SESSION = ("INSERT INTO sessions "
+                  "(variant, started, ended, score, level, genome_id, genome) "
+                  "VALUES (?, ?, ?, ?, ?, ?, ?)")
+UPSERT_TOTALS = """
+INSERT INTO genome_totals (genome_id, sessions, total_score, best_score, best_level)
+VALUES (?, 1, ?, ?, ?)
+ON CONFLICT (genome_id) DO UPDATE SET
+    sessions = sessions + 1,
+    total_score = total_score + excluded.total_score,
+    best_score = max(best_score, excluded.best_score),
+    best_level = max(best_level, excluded.best_level)
+"""
+
+
+def quantize(genome, steps=QUANT_STEPS):
+    """Genome with each parameter rounded to its step"""
+    return {name: round(round(value / steps[name]) * steps[name], 6)
+            if name in steps else value
+            for name, value in genome.items()}
+
+
+def genome_key(genome):
+    """Canonical text form of a quantized genome"""
+    return snapshot(quantize(genome))
+
+
+def snapshot(genome):
+    return json.dumps(genome, sort_keys=True, separators=(',', ':'))
+
+
+class ScoreDB:
+    def __init__(self, path='breakout.db', batch_size=64, flush_interval=5.0):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(sessions)")]
+        if 'genome' not in columns:
+            self.db.execute("ALTER TABLE sessions ADD COLUMN genome TEXT")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.last_flush = time.monotonic()
+        self.pending = []
+        self.genome_ids = {}
+        # Bumped on every flush; lets screens cache query results
+        self.version = 0
+        atexit.register(self.close)
+
+    def record_session(self, variant, score, level, started, ended=None, genome=None):
+        ended = time.time() if ended is None else ended
+        key, exact = (genome_key(genome), snapshot(genome)) if genome else (None, None)
+        self.pending.append((variant, started, ended, score, level, key, exact))
+        if (len(self.pending) >= self.batch_size or
+                time.monotonic() - self.last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        self.last_flush = time.monotonic()
+        if not self.pending:
+            return
+        sessions, totals = [], []
+        with self.db:
+            for variant, started, ended, score, level, key, exact in self.pending:
+                genome_id = self._genome_id(key) if key else None
+                sessions.append((variant, started, ended, score, level, genome_id, exact))
+                if genome_id is not None:
+                    totals.append((genome_id, score, score, level))
+            self.db.executemany(INSERT_SESSION, sessions)
+            self.db.executemany(UPSERT_TOTALS, totals)
+        self.pending.clear()
+        self.version += 1
+
+    def _genome_id(self, key):
+        genome_id = self.genome_ids.get(key)
+        if genome_id is None:
+            self.db.execute(INSERT_GENOME, (key,))
+            genome_id = self.db.execute(SELECT_GENOME, (key,)).fetchone()[0]
+            self.genome_ids[key] = genome_id
+        return genome_id
+
+    def top_scores(self, n=10, variant=None):
+        """[(score, level, ended)] best first"""
+        self.flush()
+        if variant is None:
+            return self.db.execute(
+                "SELECT score, level, ended FROM sessions "
+                "ORDER BY score DESC, level DESC LIMIT ?", (n,)).fetchall()
+        return self.db.execute(
+            "SELECT score, level, ended FROM sessions WHERE variant = ? "
+            "ORDER BY score DESC, level DESC LIMIT ?", (variant, n)).fetchall()
+
+    def top_genomes(self, n=10):
+        """[(genome, sessions, avg_score, best_score, best_level)] by best score"""
+        self.flush()
+        rows = self.db.execute(
+            "SELECT g.key, t.sessions, t.total_score, t.best_score, t.best_level "
+            "FROM genome_totals t JOIN genomes g ON g.id = t.genome_id "
+            "ORDER BY t.best_score DESC LIMIT ?", (n,)).fetchall()
+        return [(json.loads(key), sessions, total / sessions, best, level)
+                for key, sessions, total, best, level in rows]
+
+    def genome_stats(self, genome):
+        """(sessions, avg_score, best_score, best_level) or None"""
+        self.flush()
+        row = self.db.execute(
+            "SELECT t.sessions, t.total_score, t.best_score, t.best_level "
+            "FROM genome_totals t JOIN genomes g ON g.id = t.genome_id "
+            "WHERE g.key = ?", (genome_key(genome),)).fetchone()
+        if row is None:
+            return None
+        sessions, total, best, level = row
+        return sessions, total / sessions, best, level
+
+    def close(self):
+        if self.db is None:
+            return
+        atexit.unregister(self.close)
+        self.flush()
+        self.db.close()
+        self.db = None
@@ -0,0 +1,280 @@
+"""
+Local spectator stream of live game state.
+
+A game calls `SpectatorServer.publish()` once per frame. The call only
+captures a small snapshot and hands it to an asyncio loop running on its
+own thread, which encodes it once and fans it out to every connected
+viewer. Messages are length-prefixed (u32) binary frames:
+
+    header     kind u8, seq u32, ball x/y i16, ball size u8,
+               paddle x/y i16, paddle w/h u16, score u32, lives u8, level u16
+    keyframe   world w/h u16, slot count u16, per slot x/y i16 w/h u16 rgb,
+               alive bitmap
+    delta      alive bitmap XOR the previous frame's (changed brick bits)
+
+Bricks are numbered by their slot in the layout captured when the brick
+container last changed (a new level or board). Each viewer has a bounded
+queue; when it falls behind, its backlog is dropped and it is resynced with
+a keyframe, so a slow viewer costs the game nothing.
+
+    python -m engine.spectator [host] [port]
+"""
+
+import argparse
+import asyncio
+import socket
+import struct
+import threading
+import time
+
+import pygame
+
+HOST = '127.0.0.1'
+PORT = 8765
+KEYFRAME = 0
+DELTA = 1
+
+LENGTH = struct.Struct('<I')
+HEADER = struct.Struct('<BIhhBhhHHIBH')
+LAYOUT = struct.Struct('<HHH')
+SLOT = struct.Struct('<hhHHBBB')
+DEFAULT_COLOR = (228, 52, 52)
+
+
+def _bitmap(bits, slots):
+    return bits.to_bytes((slots + 7) // 8, 'little')
+
+
+class _Viewer:
+    __slots__ = ('writer', 'task', 'queue', 'resync', 'dropped')
+
+    def __init__(self, writer, max_queue):
+        self.writer = writer
+        self.task = asyncio.current_task()
+        self.queue = asyncio.Queue(max_queue)
+        self.resync = True
+        self.dropped = 0
+
+
+class SpectatorServer:
+    def __init__(self, world, host=HOST, port=PORT, max_rate=60, max_queue=8):
+        self.world = world
+        self.interval = 1 / max_rate if max_rate else 0
+        self.max_queue = max_queue
+        self.viewers = []
+        self.seq = 0
+        self.published = 0
+        self.last = 0.0
+        # Layout of the brick container we last saw (sim thread only)
+        self._bricks = None
+        self._slots = {}
+        self._layout = ()
+        self._version = 0
+        # Previous broadcast (loop thread only)
+        self._prev_version = -1
+        self._prev_alive = 0
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(
+            asyncio.start_server(self._serve, host, port))
+        self.port = self.server.sockets[0].getsockname()[1]
+        self._thread = threading.Thread(target=self.loop.run_forever,
+                                        name='spectator', daemon=True)
+        self._thread.start()
+
+    # Simulation thread
+    def publish(self, bricks, ball, paddle, score, lives, level=1):
+        """Snapshot one frame. bricks holds Bricks or bare Rects; never blocks."""
+        if not self.viewers:
+            return
+        now = time.perf_counter()
+        if now - self.last < self.interval:
+            return
+        self.last = now
+        if bricks is not self._bricks:
+            self._capture(bricks)
+        slots = self._slots
+        alive = 0
+        for brick in bricks:
+            alive |= 1 << slots[id(brick)]
+        self.published += 1
+        self.loop.call_soon_threadsafe(self._broadcast, (
+            self._version, self._layout, alive,
+            (ball.x, ball.y, ball.width), (paddle.x, paddle.y, paddle.width, paddle.height),
+            score, lives, level))
+
+    def _capture(self, bricks):
+        self._bricks = bricks
+        self._slots = {id(brick): i for i, brick in enumerate(bricks)}
+        self._layout = tuple(
+            (tuple(getattr(brick, 'rect', brick)), getattr(brick, 'color', DEFAULT_COLOR))
+            for brick in bricks)
+        self._version += 1
+
+    # Loop thread
+    def _broadcast(self, snapshot):
+        version, layout, alive, ball, paddle, score, lives, level = snapshot
+        self.seq += 1
+        slots = len(layout)
+        fresh = version != self._prev_version
+        head = (self.seq, ball[0], ball[1], ball[2], *paddle, score, lives, level)
+        delta = None
+        if not fresh:
+            delta = self._frame(HEADER.pack(DELTA, *head)
+                                + _bitmap(alive ^ self._prev_alive, slots))
+        keyframe = None
+        for viewer in self.viewers:
+            if viewer.queue.full():
+                # Behind: throw the backlog away and start over from a keyframe
+                while not viewer.queue.empty():
+                    viewer.queue.get_nowait()
+                    viewer.dropped += 1
+                viewer.resync = True
+            if viewer.resync or delta is None:
+                if keyframe is None:
+                    keyframe = self._keyframe(head, layout, alive)
+                viewer.queue.put_nowait(keyframe)
+                viewer.resync = False
+            else:
+                viewer.queue.put_nowait(delta)
+        self._prev_version = version
+        self._prev_alive = alive
+
+    def _keyframe(self, head, layout, alive):
+        parts = [HEADER.pack(KEYFRAME, *head),
+                 LAYOUT.pack(self.world[0], self.world[1], len(layout))]
+        for (x, y, w, h), color in layout:
+            parts.append(SLOT.pack(x, y, w, h, *color[:3]))
+        parts.append(_bitmap(alive, len(layout)))
+        return self._frame(b''.join(parts))
+
+    @staticmethod
+    def _frame(payload):
+        return LENGTH.pack(len(payload)) + payload
+
+    async def _serve(self, reader, writer):
+        viewer = _Viewer(writer, self.max_queue)
+        self.viewers.append(viewer)
+        try:
+            while True:
+                writer.write(await viewer.queue.get())
+                await writer.drain()
+        except (ConnectionError, OSError):
+            pass
+        except asyncio.CancelledError:
+            # close() cancels us to shut down; finish normally, since
+            # start_server's done-callback chokes on cancelled handlers
+            pass
+        finally:
+            self.viewers.remove(viewer)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    def stats(self):
+        return {'viewers': len(self.viewers), 'published': self.published,
+                'dropped': sum(viewer.dropped for viewer in self.viewers)}
+
+    async def _shutdown(self):
+        # Stop accepting, then let every viewer task close its own writer
+        self.server.close()
+        tasks = [viewer.task for viewer in self.viewers]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.server.wait_closed()
+
+    def close(self):
+        if self._thread.is_alive():
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+        if not self.loop.is_closed():
+            self.loop.close()
+
+
+# Viewer side
+class SpectatorClient:
+    """Blocking reader that rebuilds game state from the stream"""
+    def __init__(self, host=HOST, port=PORT):
+        self.sock = socket.create_connection((host, port))
+        self.stream = self.sock.makefile('rb')
+        self.world = None
+        self.layout = ()
+        self.alive = 0
+        self.state = None
+
+    def read(self):
+        """Apply the next frame; returns False when the stream ends"""
+        raw = self.stream.read(LENGTH.size)
+        if len(raw) < LENGTH.size:
+            return False
+        payload = self.stream.read(LENGTH.unpack(raw)[0])
+        kind, *head = HEADER.unpack_from(payload)
+        offset = HEADER.size
+        if kind == KEYFRAME:
+            width, height, slots = LAYOUT.unpack_from(payload, offset)
+            offset += LAYOUT.size
+            self.world = (width, height)
+            self.layout = [SLOT.unpack_from(payload, offset + i * SLOT.size)
+                           for i in range(slots)]
+            offset += slots * SLOT.size
+            self.alive = int.from_bytes(payload[offset:], 'little')
+        else:
+            self.alive ^= int.from_bytes(payload[offset:], 'little')
+        self.state = head
+        return True
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+
+def watch(host=HOST, port=PORT):
+    from .entities import Ball, Brick, BrickSet, Paddle
+    from .renderqueue import RenderQueue
+    from .scaler import ScaledDisplay
+
+    pygame.init()
+    client = SpectatorClient(host, port)
+    display = queue = None
+    font = pygame.font.Font(None, 16)
+    while client.read():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                client.close()
+                pygame.quit()
+                return
+        if display is None or display.size != client.world:
+            display = ScaledDisplay(client.world)
+            queue = RenderQueue(display.surface)
+            pygame.display.set_caption(f"Spectating {host}:{port}")
+        (seq, ball_x, ball_y, ball_size, paddle_x, paddle_y, paddle_w, paddle_h,
+         score, lives, level) = client.state
+        bricks = BrickSet(Brick(x, y, w, h, (r, g, b))
+                          for i, (x, y, w, h, r, g, b) in enumerate(client.layout)
+                          if client.alive >> i & 1)
+        ball = Ball(ball_size, (255, 255, 255), client.world[0])
+        ball.rect.topleft = (ball_x, ball_y)
+        paddle = Paddle(paddle_w, paddle_h, (255, 255, 255), (0, 0), 0)
+        paddle.rect.topleft = (paddle_x, paddle_y)
+
+        display.surface.fill((0, 0, 0))
+        queue.fill_all(bricks)
+        queue.fill(paddle.color, paddle.rect)
+        queue.fill(ball.color, ball.rect)
+        queue.blit(font.render(f"SCORE {score}  LIVES {lives}  LEVEL {level}",
+                               True, (255, 255, 255)), (4, 4), 1)
+        queue.flush()
+        display.present()
+    client.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch a running game")
+    parser.add_argument('host', nargs='?', default=HOST)
+    parser.add_argument('port', nargs='?', type=int, default=PORT)
+    args = parser.parse_args()
+    watch(args.host, args.port)
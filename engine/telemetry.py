@@ -0,0 +1,130 @@
+"""
+Buffered asynchronous telemetry sink.
+
+record() only enqueues; a background thread drains the queue in batches and
+appends them to a JSONL file or a SQLite table. When the queue is full the
+record is dropped and counted instead of blocking the game loop. If the
+writer fails (an unwritable path, a record that isn't JSON) the error is
+reported and kept, and later records are discarded.
+"""
+
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+_STOP = object()
+
+
+class TelemetryWriter:
+    def __init__(self, path, max_queue=8192, batch_size=512,
+                 flush_interval=1.0, fsync_interval=None):
+        self.path = path
+        self.sqlite = path.endswith(('.db', '.sqlite', '.sqlite3'))
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fsync_interval = fsync_interval
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        # Set by the writer thread if it fails; recording stops
+        self.error = None
+        self._thread = threading.Thread(target=self._run, name='telemetry',
+                                        daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, kind, data):
+        """Queue one record; never blocks. The dict must not be mutated later."""
+        if self.error is not None:
+            self.dropped += 1
+            return
+        try:
+            self.queue.put_nowait((time.time(), kind, data))
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        atexit.unregister(self.close)
+        if self._thread.is_alive():
+            self.queue.put(_STOP)
+            self._thread.join()
+
+    def stats(self):
+        return {
+            'queued': self.queue.qsize(),
+            'written': self.written,
+            'dropped': self.dropped,
+            'batches': self.batches,
+            'error': self.error,
+        }
+
+    # Writer thread
+    def _run(self):
+        sink = None
+        try:
+            sink = self._open_sqlite() if self.sqlite else self._open_jsonl()
+            self._drain(sink)
+        except Exception as exc:
+            self.error = exc
+            print(f"telemetry: stopped after {self.written} records to {self.path}: "
+                  f"{exc!r}", file=sys.stderr)
+        finally:
+            if sink:
+                sink.close()
+
+    def _drain(self, sink):
+        last_sync = time.monotonic()
+        running = True
+        while running:
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = []
+            while item is not _STOP:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            running = item is not _STOP
+            if batch:
+                self._write(sink, batch)
+                self.written += len(batch)
+                self.batches += 1
+            if (self.fsync_interval is not None and not self.sqlite
+                    and time.monotonic() - last_sync >= self.fsync_interval):
+                os.fsync(sink.fileno())
+                last_sync = time.monotonic()
+
+    def _open_jsonl(self):
+        return open(self.path, 'a', buffering=1 << 16, encoding='utf-8')
+
+    def _open_sqlite(self):
+        db = sqlite3.connect(self.path)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS telemetry "
+                   "(ts REAL NOT NULL, kind TEXT NOT NULL, data TEXT NOT NULL)")
+        db.commit()
+        return db
+
+    def _write(self, sink, batch):
+        if self.sqlite:
+            with sink:
+                sink.executemany(
+                    "INSERT INTO telemetry (ts, kind, data) VALUES (?, ?, ?)",
+                    [(ts, kind, json.dumps(data)) for ts, kind, data in batch])
+        else:
+            sink.write(''.join(
+                json.dumps({'ts': ts, 'kind': kind, **data}) + '\n'
+                for ts, kind, data in batch))
+            sink.flush()
@@ -0,0 +1 @@
+"""Game variants, each a module with a main(argv=None) entry point."""
@@ -0,0 +1,117 @@
+import pygame
+from .. import assets
+from ..autopilot import Autopilot
+from ..collision import collide_bricks, paddle_bounce
+from ..entities import Ball, Brick, BrickSet, Paddle
+from ..pacing import FramePacer
+from ..renderqueue import RenderQueue
+from ..scaler import ScaledDisplay
+
+# Game constants
+WIDTH, HEIGHT = 256, 224
+PADDLE_WIDTH, PADDLE_HEIGHT = 48, 8
+BALL_SIZE = 6
+BRICK_WIDTH, BRICK_HEIGHT = 32, 16
+FPS = 60
+PACING = 'sleep'  # sleep, busy, hybrid or vsync
+PACE_STATS = False  # print frame jitter statistics at exit
+CAPTURE = None  # record to a .bkrl/.raw file or a PNG directory
+AUTOPILOT = None  # skill 0-1 to let the autopilot play
+
+# Colors
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+COLORS = [
+    (255, 0, 0),
+    (255, 165, 0),
+    (255, 255, 0),
+    (0, 255, 0),
+    (0, 0, 255)
+]
+
+def create_bricks():
+    bricks = BrickSet()
+    for row in range(5):
+        for col in range(WIDTH // BRICK_WIDTH):
+            color = COLORS[row % len(COLORS)]
+            bricks.add(Brick(col*BRICK_WIDTH, 40 + row*BRICK_HEIGHT,
+                             BRICK_WIDTH, BRICK_HEIGHT, color))
+    return bricks
+
+def main(argv=None):
+    pygame.init()
+    display = ScaledDisplay((WIDTH, HEIGHT), vsync=PACING == 'vsync', capture=CAPTURE)
+    screen = display.surface
+    queue = RenderQueue(screen)
+    font = assets.font(16)
+    pygame.display.set_caption("Retro Breakout")
+    pacer = FramePacer(FPS, PACING, display.vsync, report_at_exit=PACE_STATS)
+
+    paddle = Paddle(PADDLE_WIDTH, PADDLE_HEIGHT, WHITE, (WIDTH//2, HEIGHT-30), 4)
+    ball = Ball(BALL_SIZE, WHITE, WIDTH, speed=(3, -3), center=(WIDTH//2, HEIGHT//2))
+    bricks = create_bricks()
+    lives = 3
+    score = 0
+    pilot = Autopilot(WIDTH, AUTOPILOT) if AUTOPILOT is not None else None
+
+    running = True
+    while running:
+        keys = pygame.key.get_pressed()
+        if pilot:
+            keys = pilot.press(keys, ball.rect, ball.speed, paddle.rect)
+            pilot.tap(pygame.K_SPACE, not ball.active)
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE and not ball.active:
+                    ball.active = True
+
+        # Update
+        if keys[pygame.K_LEFT] and paddle.rect.left > 0:
+            paddle.rect.x -= paddle.speed
+        if keys[pygame.K_RIGHT] and paddle.rect.right < WIDTH:
+            paddle.rect.x += paddle.speed
+        ball.update()
+
+        # Ball-paddle collision
+        if ball.rect.colliderect(paddle.rect) and ball.speed[1] > 0:
+            # Add slight angle variation based on hit position
+            paddle_bounce(ball, paddle, 4)
+
+        # Ball-brick collisions
+        hit_bricks = collide_bricks(ball, bricks)
+        if hit_bricks:
+            score += len(hit_bricks) * 10
+
+        # Ball reset
+        if ball.rect.bottom >= HEIGHT:
+            lives -= 1
+            if lives <= 0:
+                running = False
+            else:
+                ball.active = False
+                ball.rect.center = (WIDTH//2, HEIGHT//2)
+                paddle.rect.center = (WIDTH//2, HEIGHT-30)
+
+        # Drawing
+        screen.fill(BLACK)
+        queue.fill_all(bricks)
+        queue.fill(paddle.color, paddle.rect)
+        queue.fill(ball.color, ball.rect)
+        
+        # UI elements
+        score_text = font.render(f"Score: {score}", True, WHITE)
+        lives_text = font.render(f"Lives: {lives}", True, WHITE)
+        queue.blit(score_text, (8, 8), 1)
+        queue.blit(lives_text, (WIDTH - 64, 8), 1)
+        queue.flush()
+
+        display.present()
+        pacer.pace()
+
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+"""
+BREAKOUT EVO: Self-Optimizing Famicom Core
+- Autonomous difficulty balancing
+- Continuous gameplay evolution
+- Neural heuristics without external deps
+"""
+
+import pygame
+import argparse
+import functools
+import math
+import random
+import sys
+import time
+
+from .. import assets
+from ..alloctrace import AllocTracker
+from ..autopilot import Autopilot
+from ..collision import resolve
+from ..fitcache import QUANT_STEPS, FitnessCache
+from ..governor import QualityGovernor
+from ..pacing import FramePacer
+from ..renderqueue import RenderQueue
+from ..scaler import ScaledDisplay
+from ..scoredb import ScoreDB
+from ..spectator import SpectatorServer
+from ..telemetry import TelemetryWriter
+
+TELEMETRY_LOG = 'evo_telemetry.jsonl'
+SCORE_DB = 'breakout.db'
+AUTOPILOT = None  # skill 0-1 to let the autopilot play
+ALLOC_TRACE = False
+PACING = 'sleep'  # sleep, busy, hybrid or vsync
+PACE_STATS = False  # print frame jitter statistics at exit
+CAPTURE = None  # record to a .bkrl/.raw file or a PNG directory
+FITNESS_CACHE = 'evo_fitness.db'
+SPECTATOR_PORT = None  # e.g. 8765 to stream to `python -m engine.spectator` viewers
+
+def new_life(genome, rng=random):
+    """(paddle, ball, speed, bricks) for the start of a life"""
+    paddle = pygame.Rect(128 - genome['paddle_size']//2, 208, genome['paddle_size'], 8)
+    ball = pygame.Rect(124, 108, 8, 8)
+    speed = [genome['ball_speed'] * rng.choice([-1,1]), genome['ball_speed']]
+    bricks = [pygame.Rect(x*32+8, y*16+32, 24, 8)
+              for y in range(int(genome['brick_rows']))
+              for x in range(8)
+              if rng.random() > genome['chaos']]
+    return paddle, ball, speed, bricks
+
+def velocity(speed, genome):
+    """Per-frame ball displacement; aggression speeds up the base speed"""
+    aggression = genome['aggression']
+    return speed[0] * (1 + 0.5*aggression), speed[1] * (1 + 0.3*aggression)
+
+def move_paddle(paddle, direction, genome):
+    paddle.left = max(0, min(256 - paddle.width,
+                             paddle.left + direction * (5 + 3*genome['aggression'])))
+
+def step(ball, speed, paddle, bricks, genome, rng=random):
+    """Advance the ball one frame under the Evo rules; returns points scored.
+
+    Shared by the game and by play_episode, so tuned fitness always
+    measures the game that is actually played.
+    """
+    chaos = genome['chaos']
+    vx, vy = velocity(speed, genome)
+    ball.x += vx
+    ball.y += vy
+
+    # Collision system
+    if ball.left <= 0:
+        speed[0] = abs(speed[0])
+    elif ball.right >= 256:
+        speed[0] = -abs(speed[0])
+    if ball.top <= 0:
+        speed[1] = abs(speed[1])
+
+    if ball.colliderect(paddle):
+        speed[1] *= -1
+        offset = (ball.centerx - paddle.centerx)/paddle.width
+        speed[0] = offset * 5 * (1 + chaos)
+
+    hits = ball.collidelistall(bricks)
+    if not hits:
+        return 0
+    resolve(ball, speed, [bricks[i] for i in hits])
+    for i in reversed(hits):
+        del bricks[i]
+    if rng.random() < 0.1 * chaos:
+        speed[0] *= rng.choice([-1,1])
+    return 10 * len(hits)
+
+def play_episode(genome, seed, skill=0.8, max_frames=18000, spectator=None):
+    """Score of one autopilot life under a fixed genome, without a display"""
+    rng = random.Random(seed)
+    pilot = Autopilot(256, skill, seed=seed)
+    paddle, ball, speed, bricks = new_life(genome, rng)
+    score = 0
+    for _ in range(max_frames):
+        move_paddle(paddle, pilot.direction(ball, velocity(speed, genome), paddle), genome)
+        score += step(ball, speed, paddle, bricks, genome, rng)
+        if spectator:
+            spectator.publish(bricks, ball, paddle, score, 1)
+        if ball.bottom >= 224 or not bricks:
+            break
+    return score
+
+class DeepSeekCore:
+    def __init__(self):
+        self.genome = {
+            'ball_speed': 3.0,
+            'paddle_size': 48,
+            'brick_rows': 4,
+            'aggression': 0.5,
+            'chaos': 0.1
+        }
+        self.history = []
+        self.evolution_cycle = 0
+        
+    def adapt(self, metrics):
+        """Neural parameter optimization"""
+        self.history.append(metrics)
+        if len(self.history) > 100:
+            self._evolve_genome()
+            self.history = []
+            
+        # Real-time parameter adjustment
+        self.genome['ball_speed'] *= 1 + (0.1 * math.sin(self.evolution_cycle/10))
+        self.genome['chaos'] += random.uniform(-0.01, 0.01)
+        self.genome['chaos'] = max(0, min(1, self.genome['chaos']))
+        self.evolution_cycle += 1
+        
+    def _evolve_genome(self):
+        """Genetic algorithm optimization"""
+        avg_score = sum(m['score'] for m in self.history)/len(self.history)
+        survival_rate = sum(m['lives'] for m in self.history)/(3*len(self.history))
+        
+        # Evolutionary pressures
+        self.genome['paddle_size'] = max(24, min(96, 
+            48 + (avg_score//1000) - (survival_rate * 10)))
+        self.genome['brick_rows'] = min(6, max(2, int(4 + avg_score//500)))
+        self.genome['aggression'] = 0.3 + (avg_score/10000)
+
+    def tune(self, cache, rounds=20, seeds=(0, 1, 2), target=200, play=play_episode):
+        """Hill-climb the genome toward an autopilot score of `target`"""
+        limits = {'ball_speed': (1.0, 6.0), 'paddle_size': (24, 96),
+                  'brick_rows': (2, 6), 'aggression': (0.0, 1.0), 'chaos': (0.0, 1.0)}
+
+        def fitness(genome):
+            scores = [cache.evaluate(genome, seed, play) for seed in seeds]
+            return -abs(sum(scores)/len(scores) - target)
+
+        best = dict(self.genome)
+        best_fit = fitness(best)
+        for _ in range(rounds):
+            improved = False
+            # Neighbours one quantization step away; revisits hit the cache
+            for name, step in QUANT_STEPS.items():
+                low, high = limits[name]
+                for delta in (-step, step):
+                    candidate = dict(best)
+                    candidate[name] = max(low, min(high, best[name] + delta))
+                    fit = fitness(candidate)
+                    if fit > best_fit:
+                        best, best_fit, improved = candidate, fit, True
+            if not improved:
+                break
+        self.genome = best
+        return best, best_fit
+
+class BreakoutEvo:
+    def __init__(self, telemetry=None, scores=None, pilot=None, tracker=None,
+                 spectator=None):
+        pygame.init()
+        self.display = ScaledDisplay((256, 224), vsync=PACING == 'vsync',
+                                     capture=CAPTURE)
+        self.screen = self.display.surface
+        self.queue = RenderQueue(self.screen)
+        self.ball_sprite = pygame.Surface((8, 8))
+        self.ball_sprite.set_colorkey((0,0,0))
+        pygame.draw.ellipse(self.ball_sprite, (255,255,255), self.ball_sprite.get_rect())
+        self.pacer = FramePacer(60, PACING, self.display.vsync, report_at_exit=PACE_STATS)
+        self.governor = QualityGovernor(60)
+        self.font = assets.font(16, 'arial')
+        self.hud = None
+        self.ai = DeepSeekCore()
+        self.telemetry = telemetry
+        self.scores = scores
+        self.pilot = pilot
+        self.tracker = tracker
+        self.spectator = spectator
+        self.episode = 0
+        self.reset_state()
+        
+    def reset_state(self):
+        self.paddle, self.ball, self.ball_speed, self.bricks = new_life(self.ai.genome)
+        self.score = 0
+        self.lives = 3
+        self.episode_frames = 0
+        self.episode_start = time.perf_counter()
+        self.episode_wall = time.time()
+        
+    def run(self):
+        while True:
+            dt = self.pacer.interval_ms/1000
+            start = time.perf_counter()
+            tracker = self.tracker
+            if tracker: tracker.phase('input')
+            self.process_input()
+            if tracker: tracker.phase('update')
+            self.update_game(dt)
+            if tracker: tracker.phase('adapt')
+            metrics = {
+                'score': self.score,
+                'lives': self.lives,
+                'bricks': len(self.bricks),
+                'quality': self.governor.level
+            }
+            self.ai.adapt(metrics)
+            if tracker: tracker.phase('render')
+            self.render()
+            if tracker: tracker.phase('telemetry')
+            if self.spectator:
+                self.spectator.publish(self.bricks, self.ball, self.paddle,
+                                       self.score, self.lives)
+            # Vsync waits in the flip aren't load
+            frame_ms = (time.perf_counter() - start) * 1000 - self.display.blocked_ms
+            if self.governor.tick(frame_ms):
+                self.governor.apply()
+            self.episode_frames += 1
+            if self.telemetry:
+                self.telemetry.record('frame', {
+                    **metrics,
+                    'episode': self.episode,
+                    'frame_ms': round(frame_ms, 3),
+                    'genome': dict(self.ai.genome)
+                })
+            if tracker: tracker.end_frame()
+            self.pacer.pace()
+            
+    def process_input(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                if self.telemetry:
+                    self.telemetry.close()
+                if self.scores:
+                    self.scores.close()
+                if self.spectator:
+                    self.spectator.close()
+                pygame.quit()
+                sys.exit()
+                
+        keys = pygame.key.get_pressed()
+        genome = self.ai.genome
+        if self.pilot:
+            keys = self.pilot.press(keys, self.ball, velocity(self.ball_speed, genome),
+                                    self.paddle)
+        move_paddle(self.paddle, keys[pygame.K_RIGHT] - keys[pygame.K_LEFT], genome)
+
+    def update_game(self, dt):
+        self.score += step(self.ball, self.ball_speed, self.paddle, self.bricks,
+                           self.ai.genome)
+        if self.ball.bottom >= 224:
+            self.lives -= 1
+            self.end_episode()
+            if self.lives > 0:
+                self.reset_state()
+            else:
+                self.ai.genome['chaos'] *= 0.9
+                self.reset_state()
+
+    def end_episode(self):
+        if self.telemetry:
+            self.telemetry.record('episode', {
+                'episode': self.episode,
+                'score': self.score,
+                'lives': self.lives,
+                'bricks': len(self.bricks),
+                'frames': self.episode_frames,
+                'seconds': round(time.perf_counter() - self.episode_start, 3),
+                'genome': dict(self.ai.genome)
+            })
+        if self.scores:
+            self.scores.record_session('evo', self.score, 1, self.episode_wall,
+                                       genome=self.ai.genome)
+        self.episode += 1
+
+    def render(self):
+        self.screen.fill((0,0,0))
+        queue = self.queue
+        # Bricks
+        colors = ((64,120,228), (228,52,52))
+        for idx, brick in enumerate(self.bricks):
+            queue.fill(colors[idx & 1], brick)
+        # Paddle
+        queue.fill((255,255,255), self.paddle)
+        # Ball
+        queue.blit(self.ball_sprite, self.ball)
+        # UI
+        if self.hud is None or self.governor.refresh_hud():
+            self.hud = self.font.render(f"SCORE: {self.score} GEN: {self.ai.evolution_cycle}", True, (255,255,255))
+        queue.blit(self.hud, (8, 8), 1)
+        queue.flush()
+        self.display.present()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Breakout Evo")
+    parser.add_argument('--tune', type=int, metavar='ROUNDS',
+                        help="tune the genome headlessly instead of playing")
+    args = parser.parse_args(argv)
+    spectator = SpectatorServer((256, 224), port=SPECTATOR_PORT) if SPECTATOR_PORT else None
+    if args.tune:
+        core = DeepSeekCore()
+        cache = FitnessCache(FITNESS_CACHE)
+        start = time.perf_counter()
+        genome, fit = core.tune(cache, args.tune,
+                                play=functools.partial(play_episode, spectator=spectator))
+        cache.close()
+        print(f"genome {genome} fitness {fit:.1f} "
+              f"in {time.perf_counter() - start:.1f}s")
+        print(f"cache {cache.stats()}")
+        return
+    BreakoutEvo(
+        TelemetryWriter(TELEMETRY_LOG) if TELEMETRY_LOG else None,
+        ScoreDB(SCORE_DB) if SCORE_DB else None,
+        Autopilot(256, AUTOPILOT) if AUTOPILOT is not None else None,
+        AllocTracker() if ALLOC_TRACE else None,
+        spectator
+    ).run()
+
+if __name__ == "__main__":
+    main()
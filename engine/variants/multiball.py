@@ -0,0 +1,137 @@
+import pygame
+import random
+from pygame.locals import *
+from .. import host
+from ..collision import collide_bricks, paddle_bounce
+from ..entities import Ball, Paddle
+
+class Config(host.Config):
+    VARIANT = 'multiball'
+    PARTICLES = False
+    SCORE_DB = None
+    SOUNDS = ('hit', 'break', 'powerup', 'death', 'music')
+
+# Main Game Loop
+class RetroBreakout:
+    def __init__(self, config=Config):
+        self.host = host.Host(config)
+        self.config = config
+        self.colors = config.COLORS
+        self.hud = None
+        self.reset_game()
+
+    def reset_game(self):
+        c = self.config
+        self.paddle = Paddle(c.PADDLE_W, c.PADDLE_H, self.colors['paddle'],
+                             (c.WIDTH//2, c.HEIGHT-30), 5)
+        self.lives = 3
+        self.score = 0
+        self.level = 1
+        self.bricks = self.host.prefetch.take(self.level)
+        self.game_over = False
+        self.new_ball()
+
+    def new_ball(self):
+        """Single ball waiting on the paddle for a serve"""
+        c = self.config
+        self.balls = [Ball(c.BALL_SIZE, self.colors['ball'], c.WIDTH, speed=(3, -3),
+                           center=(c.WIDTH//2, c.HEIGHT//2))]
+
+    def run(self):
+        host = self.host
+        host.sound.sfx['music'].play(-1)
+        while True:
+            host.begin_frame()
+            if not self.handle_input():
+                break
+            host.phase('update')
+            self.update()
+            host.phase('draw')
+            self.draw()
+            host.end_frame()
+        host.close()
+
+    def handle_input(self):
+        """Apply this frame's input; False once the window is closed"""
+        pilot = self.host.pilot
+        serving = not self.game_over and not self.balls[0].active
+        if pilot:
+            pilot.tap(K_SPACE, serving)
+            pilot.tap(K_r, self.game_over)
+        for event in pygame.event.get():
+            if event.type == QUIT:
+                return False
+            if event.type == KEYDOWN:
+                if event.key == K_SPACE and serving:
+                    self.balls[0].active = True
+                    self.balls[0].speed = [random.choice([-3, 3]), -3]
+                if event.key == K_r and self.game_over:
+                    self.reset_game()
+
+        keys = pygame.key.get_pressed()
+        if pilot:
+            # Track the lowest ball, the next one to reach the paddle
+            ball = max(self.balls, key=lambda b: b.rect.bottom)
+            keys = pilot.press(keys, ball.rect, ball.speed, self.paddle.rect)
+        if keys[K_LEFT]: self.paddle.rect.x -= 5
+        if keys[K_RIGHT]: self.paddle.rect.x += 5
+        self.paddle.rect.clamp_ip(self.host.screen.get_rect())
+        return True
+
+    def update(self):
+        sfx = self.host.sound.sfx
+        if self.game_over:
+            return
+        for ball in self.balls:
+            if not ball.active: continue
+            ball.update()
+
+            # Collision detection
+            if ball.rect.colliderect(self.paddle.rect) and ball.speed[1] > 0:
+                paddle_bounce(ball, self.paddle, 5)
+                sfx['hit'].play()
+
+            # Brick collisions
+            hits = collide_bricks(ball, self.bricks)
+            if hits:
+                self.score += len(hits) * 10
+                sfx['break'].play()
+
+        self.balls = [ball for ball in self.balls if ball.rect.top <= self.config.HEIGHT]
+        if not self.balls:
+            self.lives -= 1
+            sfx['death'].play()
+            self.game_over = self.lives <= 0
+            if self.game_over:
+                # A restart begins at level 1 again; have it ready
+                self.host.prefetch.prefetch(1)
+            self.new_ball()
+        elif not self.bricks:
+            self.level += 1
+            self.bricks = self.host.prefetch.take(self.level)
+            self.new_ball()
+
+    def draw(self):
+        host, colors = self.host, self.colors
+        host.screen.fill(colors['bg'])
+        queue = host.queue
+        queue.fill_all(self.bricks)
+        queue.fill_all(self.balls)
+        queue.fill(self.paddle.color, self.paddle.rect)
+        if self.hud is None or (host.governor.refresh_hud() and
+                self.hud_key != (self.score, self.lives, self.game_over)):
+            self.hud_key = (self.score, self.lives, self.game_over)
+            status = "GAME OVER - PRESS R" if self.game_over else f"Lives: {self.lives}"
+            self.hud = (host.font.render(f"Score: {self.score}", True, colors['text']),
+                        host.font.render(status, True, colors['text']))
+        queue.blit(self.hud[0], (10, 10), 1)
+        queue.blit(self.hud[1], (self.config.WIDTH - self.hud[1].get_width() - 10, 10), 1)
+        queue.flush()
+        host.present()
+
+def main(argv=None):
+    pygame.init()
+    RetroBreakout().run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import pygame
+from pygame.locals import *
+from .. import host
+
+class Config(host.Config):
+    VARIANT = 'retro'
+
+# Main Game Loop
+class RetroBreakout:
+    def __init__(self, config=Config):
+        self.host = host.Host(config)
+        self.colors = config.COLORS
+        self.go_text = self.host.font.render("GAME OVER - PRESS R", True, self.colors['text'])
+        self.best_text = None
+        self.field = self.host.play_field(self.game_ended)
+
+    def run(self):
+        host, field = self.host, self.field
+        while True:
+            host.begin_frame()
+            if not self.handle_input():
+                break
+            host.phase('update')
+            field.update()
+            host.publish(field)
+            host.phase('draw')
+            self.draw()
+            host.end_frame()
+        host.close()
+
+    def handle_input(self):
+        """Apply this frame's input; False once the window is closed"""
+        field, pilot = self.field, self.host.pilot
+        if pilot:
+            pilot.tap(K_SPACE, field.serving)
+            pilot.tap(K_r, field.game_over)
+        for event in pygame.event.get():
+            if event.type == QUIT:
+                return False
+            if event.type == KEYDOWN:
+                if event.key == K_SPACE:
+                    field.serve()
+                if event.key == K_r and field.game_over:
+                    field.reset()
+
+        keys = pygame.key.get_pressed()
+        if pilot:
+            keys = pilot.press(keys, field.ball.rect, field.ball.speed, field.paddle.rect)
+        field.move_paddle(keys)
+        return True
+
+    def game_ended(self, field):
+        host = self.host
+        host.record(field.score, field.level, field.started)
+        if host.scores:
+            best = host.scores.top_scores(1, host.config.VARIANT)[0][0]
+            self.best_text = host.font.render(f"BEST: {best}", True, self.colors['text'])
+
+    def draw(self):
+        host, field = self.host, self.field
+        host.screen.fill(self.colors['bg'])
+        if field.game_over:
+            x, y = field.width//2 - 100, field.height//2
+            host.queue.blit(self.go_text, (x, y), 1)
+            if self.best_text:
+                host.queue.blit(self.best_text, (x, y + 24), 1)
+        field.draw(host.queue, host.font, host.governor.refresh_hud())
+        host.present()
+
+def main(argv=None):
+    pygame.init()
+    RetroBreakout().run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import pygame
+from pygame.locals import *
+from .. import assets, host
+
+class Config(host.Config):
+    VARIANT = 'states'
+    CAPTION = "Retro Breakout 5130X"
+
+# Game States
+class GameState:
+    MENU = 0
+    PLAYING = 1
+    GAME_OVER = 2
+    CREDITS = 3
+    SCORES = 4
+
+# Game States Implementation
+class MainMenu:
+    def __init__(self, game):
+        self.game = game
+        self.options = ["Play", "Scores", "Credits", "Exit"]
+        self.selected = 0
+        self.font = assets.font(32)
+        self.title_font = assets.font(48)
+
+    def handle_input(self, event):
+        if event.type == KEYDOWN:
+            if event.key == K_UP:
+                self.selected = (self.selected - 1) % len(self.options)
+            elif event.key == K_DOWN:
+                self.selected = (self.selected + 1) % len(self.options)
+            elif event.key == K_SPACE:
+                if self.options[self.selected] == "Play":
+                    self.game.start_new_game()
+                elif self.options[self.selected] == "Scores":
+                    self.game.current_state = GameState.SCORES
+                elif self.options[self.selected] == "Credits":
+                    self.game.current_state = GameState.CREDITS
+                elif self.options[self.selected] == "Exit":
+                    self.game.host.close()
+                    exit()
+
+    def draw(self, screen):
+        colors = self.game.colors
+        width, height = screen.get_size()
+        screen.fill(colors['bg'])
+        title = self.title_font.render("RETRO BREAKOUT", True, colors['text'])
+        screen.blit(title, (width//2 - title.get_width()//2, 50))
+        
+        for i, option in enumerate(self.options):
+            color = colors['text'] if i != self.selected else (255, 0, 0)
+            text = self.font.render(option, True, color)
+            screen.blit(text, (width//2 - text.get_width()//2, 120 + i*30))
+        
+        footer = self.font.render("Use ARROW KEYS and SPACE", True, colors['text'])
+        screen.blit(footer, (width//2 - footer.get_width()//2, height - 50))
+
+class PlayState:
+    def __init__(self, game):
+        self.game = game
+        self.field = game.host.play_field(game.show_game_over)
+
+    def handle_input(self, event):
+        if event.type == KEYDOWN and event.key == K_SPACE:
+            self.field.serve()
+
+    def update(self):
+        field = self.field
+        keys = pygame.key.get_pressed()
+        pilot = self.game.host.pilot
+        if pilot:
+            keys = pilot.press(keys, field.ball.rect, field.ball.speed, field.paddle.rect)
+        field.move_paddle(keys)
+        field.update()
+
+    def draw(self, screen):
+        host = self.game.host
+        screen.fill(self.game.colors['bg'])
+        self.field.draw(host.queue, host.font, host.governor.refresh_hud())
+
+class GameOverState:
+    def __init__(self, game, final_score, final_level):
+        self.game = game
+        self.final_score = final_score
+        self.final_level = final_level
+        self.font = assets.font(32)
+        self.title_font = assets.font(48)
+
+    def handle_input(self, event):
+        if event.type == KEYDOWN:
+            if event.key == K_r:
+                self.game.start_new_game()
+            elif event.key == K_ESCAPE:
+                self.game.current_state = GameState.MENU
+
+    def draw(self, screen):
+        colors = self.game.colors
+        width = screen.get_width()
+        screen.fill(colors['bg'])
+        title = self.title_font.render("GAME OVER", True, (255, 0, 0))
+        screen.blit(title, (width//2 - title.get_width()//2, 50))
+        
+        score_text = self.font.render(f"Final Score: {self.final_score}", True, colors['text'])
+        level_text = self.font.render(f"Level Reached: {self.final_level}", True, colors['text'])
+        screen.blit(score_text, (width//2 - score_text.get_width()//2, 150))
+        screen.blit(level_text, (width//2 - level_text.get_width()//2, 200))
+        
+        retry = self.font.render("Press R to Retry", True, colors['text'])
+        menu = self.font.render("Press ESC for Menu", True, colors['text'])
+        screen.blit(retry, (width//2 - retry.get_width()//2, 300))
+        screen.blit(menu, (width//2 - menu.get_width()//2, 350))
+
+class ScoresState:
+    def __init__(self, game):
+        self.game = game
+        self.title_font = assets.font(48)
+        self.version = None
+        self.lines = []
+
+    def handle_input(self, event):
+        if event.type == KEYDOWN and event.key == K_ESCAPE:
+            self.game.current_state = GameState.MENU
+
+    def refresh(self):
+        colors = self.game.colors
+        scores = self.game.host.scores.top_scores(8, self.game.host.config.VARIANT)
+        self.version = self.game.host.scores.version
+        self.lines = [
+            self.game.host.font.render(f"{rank}. {score:>7}   LEVEL {level}", True, colors['text'])
+            for rank, (score, level, _) in enumerate(scores, 1)
+        ] or [self.game.host.font.render("No scores yet", True, colors['text'])]
+
+    def draw(self, screen):
+        colors = self.game.colors
+        width = screen.get_width()
+        screen.fill(colors['bg'])
+        title = self.title_font.render("HIGH SCORES", True, colors['text'])
+        screen.blit(title, (width//2 - title.get_width()//2, 50))
+
+        if self.game.host.scores and self.game.host.scores.version != self.version:
+            self.refresh()
+        for i, text in enumerate(self.lines):
+            screen.blit(text, (width//2 - text.get_width()//2, 110 + i*22))
+
+class CreditsState:
+    def __init__(self, game):
+        self.game = game
+        self.font = assets.font(32)
+        self.title_font = assets.font(48)
+
+    def handle_input(self, event):
+        if event.type == KEYDOWN and event.key == K_ESCAPE:
+            self.game.current_state = GameState.MENU
+
+    def draw(self, screen):
+        colors = self.game.colors
+        width = screen.get_width()
+        screen.fill(colors['bg'])
+        title = self.title_font.render("CREDITS", True, colors['text'])
+        screen.blit(title, (width//2 - title.get_width()//2, 50))
+        
+        lines = [
+            "Developed using DeepSeek AI",
+            "Published by Flames Co.",
+            "Special thanks to:",
+            "Pygame Community",
+            "Open Source Contributors",
+            " ",
+            "© 20XX Flames Co.",
+            "All rights reserved"
+        ]
+        
+        for i, line in enumerate(lines):
+            text = self.font.render(line, True, colors['text'])
+            screen.blit(text, (width//2 - text.get_width()//2, 150 + i*30))
+
+class RetroBreakout:
+    def __init__(self, config=Config):
+        self.host = host.Host(config)
+        self.colors = config.COLORS
+        # The first level is ready by the time the player leaves the menu
+        self.host.prefetch.prefetch(1)
+        self.current_state = GameState.MENU
+        self.state_handlers = {
+            GameState.MENU: MainMenu(self),
+            GameState.PLAYING: None,
+            GameState.GAME_OVER: None,
+            GameState.CREDITS: CreditsState(self),
+            GameState.SCORES: ScoresState(self)
+        }
+
+    def start_new_game(self):
+        self.state_handlers[GameState.PLAYING] = PlayState(self)
+        self.current_state = GameState.PLAYING
+
+    def show_game_over(self, field):
+        self.host.record(field.score, field.level, field.started)
+        self.state_handlers[GameState.GAME_OVER] = GameOverState(self, field.score, field.level)
+        self.current_state = GameState.GAME_OVER
+
+    def drive_pilot(self):
+        play = self.state_handlers[GameState.PLAYING]
+        serving = (self.current_state == GameState.MENU or
+                   self.current_state == GameState.PLAYING and play.field.serving)
+        self.host.pilot.tap(K_SPACE, serving)
+        self.host.pilot.tap(K_r, self.current_state == GameState.GAME_OVER)
+
+    def run(self):
+        host = self.host
+        while True:
+            host.begin_frame()
+            if host.pilot:
+                self.drive_pilot()
+            for event in pygame.event.get():
+                if event.type == QUIT:
+                    host.close()
+                    return
+                
+                handler = self.state_handlers.get(self.current_state)
+                if handler:
+                    handler.handle_input(event)
+
+            host.phase('update')
+            if self.current_state == GameState.PLAYING:
+                play = self.state_handlers[GameState.PLAYING]
+                play.update()
+                host.publish(play.field)
+                
+            host.phase('draw')
+            host.screen.fill(self.colors['bg'])
+            handler = self.state_handlers.get(self.current_state)
+            if handler:
+                handler.draw(host.screen)
+            
+            host.present()
+            host.end_frame()
+
+def main(argv=None):
+    pygame.init()
+    RetroBreakout().run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Split-screen AI tournament: many autopilot games in one process.
+
+Every match is advanced in the same loop and drawn into its own subsurface
+tile of a single window, followed by one display.flip per frame. The font,
+the solid brick surfaces and the CRT overlay are built once and shared by
+all tiles. When the tiles are smaller than the native 256x224 resolution,
+each match is drawn into one shared native scratch surface and scaled into
+its tile.
+
+    python -m engine tournament --games 16
+"""
+
+import argparse
+import math
+import random
+import time
+
+import pygame
+
+from .. import assets
+from ..autopilot import Autopilot
+from ..collision import collide_bricks, paddle_bounce
+from ..entities import Ball, Paddle
+from ..governor import QualityGovernor
+from ..levelpack import LevelBuilder
+from ..pacing import FramePacer
+from ..renderqueue import RenderQueue
+
+NATIVE = (256, 224)
+FPS = 60
+BRICK_COLS = 8
+COLORS = {
+    'bg': (0, 0, 0),
+    'paddle': (255, 255, 255),
+    'ball': (255, 255, 255),
+    'text': (255, 255, 255),
+    'bricks': [(228, 52, 52), (248, 120, 48), (248, 240, 72),
+               (104, 224, 100), (64, 120, 228), (160, 80, 220)],
+}
+build_level = LevelBuilder(NATIVE[0], BRICK_COLS, COLORS['bricks'], top=32, row_height=12)
+
+
+class Match:
+    """One autopilot game at native resolution"""
+    def __init__(self, name, skill, seed):
+        self.name = name
+        self.skill = skill
+        self.rng = random.Random(seed)
+        self.pilot = Autopilot(NATIVE[0], skill, seed=seed)
+        self.paddle = Paddle(48, 8, COLORS['paddle'], (NATIVE[0]//2, NATIVE[1] - 16), 4)
+        self.ball = Ball(6, COLORS['ball'], NATIVE[0])
+        self.score = 0
+        self.lives = 3
+        self.level = 1
+        self.over = False
+        self.hud = None
+        self.hud_key = None
+        self.new_level()
+        self.serve()
+
+    def new_level(self):
+        self.bricks = build_level(self.level, self.rng)
+
+    def serve(self):
+        self.ball.rect.center = (NATIVE[0]//2, NATIVE[1]//2)
+        self.ball.speed = [self.rng.choice([-3, 3]), -3]
+        self.ball.active = True
+
+    def step(self):
+        if self.over:
+            return
+        ball, paddle = self.ball, self.paddle
+        paddle.rect.x += self.pilot.direction(ball.rect, ball.speed, paddle.rect) * paddle.speed
+        paddle.rect.clamp_ip((0, 0) + NATIVE)
+        ball.update()
+
+        if ball.rect.colliderect(paddle.rect) and ball.speed[1] > 0:
+            paddle_bounce(ball, paddle, 4)
+
+        hits = collide_bricks(ball, self.bricks)
+        if hits:
+            self.score += 10 * len(hits)
+
+        if ball.rect.top > NATIVE[1]:
+            self.lives -= 1
+            if self.lives <= 0:
+                self.over = True
+            else:
+                self.serve()
+        elif not self.bricks:
+            self.level += 1
+            self.new_level()
+            self.serve()
+
+    def draw(self, surface, queue, font):
+        surface.fill(COLORS['bg'])
+        queue.fill_all(self.bricks)
+        queue.fill(self.paddle.color, self.paddle.rect)
+        if not self.over:
+            queue.fill(self.ball.color, self.ball.rect)
+        key = (self.score, self.lives, self.over)
+        if key != self.hud_key:
+            self.hud_key = key
+            status = "OUT" if self.over else f"x{self.lives}"
+            self.hud = font.render(f"{self.name}  {self.score}  {status}",
+                                   True, COLORS['text'])
+        queue.blit(self.hud, (4, 4), 1)
+        queue.flush()
+
+
+def tile_size(games, margin=64):
+    """(cols, rows, (tile_w, tile_h)) laying out `games` tiles on the desktop"""
+    cols = math.ceil(math.sqrt(games))
+    rows = math.ceil(games / cols)
+    try:
+        desk_w, desk_h = pygame.display.get_desktop_sizes()[0]
+    except (pygame.error, IndexError):
+        desk_w, desk_h = cols * NATIVE[0] + margin, rows * NATIVE[1] + margin
+    scale = min((desk_w - margin) / (cols * NATIVE[0]),
+                (desk_h - margin) / (rows * NATIVE[1]))
+    # Whole multiples when upscaling, so pixels stay square
+    scale = max(1, int(scale)) if scale >= 1 else scale
+    return cols, rows, (max(1, int(NATIVE[0] * scale)), max(1, int(NATIVE[1] * scale)))
+
+
+class Tournament:
+    def __init__(self, games=16, seed=0, crt=True, pacing='sleep'):
+        pygame.init()
+        cols, rows, (tile_w, tile_h) = tile_size(games)
+        size = (cols * tile_w, rows * tile_h)
+        self.vsync = False
+        self.blocked_ms = 0.0
+        if pacing == 'vsync':
+            # As in ScaledDisplay: SDL only offers vsync through its renderer
+            try:
+                self.window = pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+                self.vsync = True
+            except pygame.error:
+                print("tournament: vsync unavailable, pacing with hybrid instead")
+        if not self.vsync:
+            self.window = pygame.display.set_mode(size)
+        pygame.display.set_caption(f"Breakout tournament: {games} games")
+        self.tiles = [self.window.subsurface((i % cols * tile_w, i // cols * tile_h,
+                                              tile_w, tile_h))
+                      for i in range(games)]
+        self.tile_size = (tile_w, tile_h)
+        # Shared by every tile
+        self.font = assets.font(16)
+        solids = {}
+        self.crt = assets.crt(self.tile_size) if crt else None
+        if self.tile_size == NATIVE:
+            self.scratch = None
+            self.queues = [RenderQueue(tile, solids) for tile in self.tiles]
+        else:
+            self.scratch = pygame.Surface(NATIVE, 0, self.window)
+            self.queues = [RenderQueue(self.scratch, solids)] * games
+        self.governor = QualityGovernor(FPS)
+        self.pacer = FramePacer(FPS, pacing, self.vsync)
+        rng = random.Random(seed)
+        self.matches = [Match(f"AI{i + 1}", round(rng.uniform(0.4, 1.0), 2),
+                              seed * 1000 + i)
+                        for i in range(games)]
+        self.frames = 0
+
+    def draw(self):
+        scratch = self.scratch
+        for match, tile, queue in zip(self.matches, self.tiles, self.queues):
+            if scratch is None:
+                match.draw(tile, queue, self.font)
+            else:
+                match.draw(scratch, queue, self.font)
+                pygame.transform.scale(scratch, self.tile_size, tile)
+            if self.crt:
+                self.crt.apply(tile)
+        if self.vsync:
+            flip_start = time.perf_counter()
+            pygame.display.flip()
+            self.blocked_ms = (time.perf_counter() - flip_start) * 1000
+        else:
+            pygame.display.flip()
+
+    def run(self, max_frames=None):
+        while max_frames is None or self.frames < max_frames:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return self.standings()
+            start = time.perf_counter()
+            for match in self.matches:
+                match.step()
+            self.draw()
+            self.frames += 1
+            # Vsync waits in the flip aren't load
+            if self.governor.tick((time.perf_counter() - start) * 1000 - self.blocked_ms):
+                self.governor.apply(self.crt)
+            self.pacer.pace()
+            if all(match.over for match in self.matches):
+                break
+        return self.standings()
+
+    def standings(self):
+        return sorted(self.matches, key=lambda m: (m.score, m.level), reverse=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run an autopilot tournament")
+    parser.add_argument('--games', type=int, default=16)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--frames', type=int, help="stop after this many frames")
+    parser.add_argument('--no-crt', action='store_true')
+    parser.add_argument('--pacing', default='sleep',
+                        choices=('sleep', 'busy', 'hybrid', 'vsync'))
+    args = parser.parse_args(argv)
+    tournament = Tournament(args.games, args.seed, not args.no_crt, args.pacing)
+    results = tournament.run(args.frames)
+    pygame.quit()
+    for rank, match in enumerate(results, 1):
+        print(f"{rank:>3}. {match.name:<6} skill {match.skill:.2f}  "
+              f"score {match.score:>6}  level {match.level}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""
+Autopilot tournament, now engine/variants/tournament.py.
+Same as `python -m engine tournament`.
+"""
+
+from engine.launcher import main
+
+if __name__ == "__main__":
+    main('tournament')